@@ -3,30 +3,44 @@
 Script para criar um PDF de extrato bancário de exemplo para testes.
 """
 
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import mm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_RIGHT
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import SimpleNamespace
+
+
+# Helper to safely get a color: prefer named attribute if present, otherwise fall back to HexColor
+def _safe_color(colors, name, fallback_hex):
+    attr = getattr(colors, name, None)
+    if attr:
+        return attr
+    # Some reportlab fakes provide HexColor; others provide constants. Try HexColor when available.
+    hexfunc = getattr(colors, 'HexColor', None)
+    if callable(hexfunc):
+        return hexfunc(fallback_hex)
+    return fallback_hex
+
+
+@lru_cache(maxsize=None)
+def _pdf_resources():
+    """Importa o reportlab e monta estilos e cores só no primeiro PDF gerado.
+
+    O import do reportlab é caro; adiá-lo mantém o carregamento do módulo rápido
+    e os recursos continuam sendo construídos uma única vez por processo.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib import colors
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+
+    try:
+        from reportlab import rl_config
+        # Dispensa a validação de formas a cada desenho; o conteúdo aqui é fixo
+        rl_config.shapeChecking = 0
+    except ImportError:
+        pass
 
-
-def create_sample_statement():
-    """Cria um extrato bancário de exemplo em PDF."""
-
-    # Criar diretório se não existir
-    os.makedirs("data/samples", exist_ok=True)
-
-    # Nome do arquivo
-    filename = "data/samples/extrato_exemplo.pdf"
-
-    # Criar documento
-    doc = SimpleDocTemplate(filename, pagesize=A4)
-    story = []
-
-    # Estilos
     styles = getSampleStyleSheet()
     title_style = ParagraphStyle(
         'CustomTitle',
@@ -36,70 +50,22 @@ def create_sample_statement():
         alignment=TA_CENTER
     )
 
-    # Cabeçalho
-    story.append(Paragraph("BANCO EXEMPLO S.A.", title_style))
-    story.append(Spacer(1, 12))
-    story.append(Paragraph("Extrato de Conta Corrente", styles['Heading2']))
-    story.append(Spacer(1, 12))
+    grey = _safe_color(colors, 'grey', '#808080')
+    whitesmoke = _safe_color(colors, 'whitesmoke', '#F5F5F5')
+    white = _safe_color(colors, 'white', '#FFFFFF')
+    lightgrey = _safe_color(colors, 'lightgrey', '#D3D3D3')
+    black = _safe_color(colors, 'black', '#000000')
 
-    # Informações da conta
-    info_data = [
-        ["Agência:", "1234", "Conta:", "56789-0"],
-        ["Cliente:", "João da Silva", "CPF:", "123.456.789-00"],
-        ["Período:", "01/08/2025 a 31/08/2025", "", ""]
-    ]
-
-    info_table = Table(info_data, colWidths=[60, 120, 60, 120])
-    info_table.setStyle(TableStyle([
+    info_table_style = TableStyle([
         ('FONTSIZE', (0, 0), (-1, -1), 10),
         ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
         ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-    ]))
-
-    story.append(info_table)
-    story.append(Spacer(1, 20))
+    ])
 
-    # Saldo anterior
-    story.append(Paragraph("Saldo Anterior (31/07/2025): € 2.500,00", styles['Normal']))
-    story.append(Spacer(1, 12))
-
-    # Transações
-    transactions = [
-        ["Data", "Descrição", "Valor", "Saldo"],
-        ["01/08", "SALARIO EMPRESA XYZ", "€ 5.000,00 C", "€ 7.500,00"],
-        ["02/08", "PIX ENVIADO MARIA SILVA", "€ 150,00 D", "€ 7.350,00"],
-        ["03/08", "SUPERMERCADO EXTRA", "€ 287,45 D", "€ 7.062,55"],
-        ["05/08", "FARMACIA POPULAR", "€ 89,90 D", "€ 6.972,65"],
-        ["07/08", "UBER TRIP", "€ 23,50 D", "€ 6.949,15"],
-        ["08/08", "RESTAURANTE SABOR", "€ 156,00 D", "€ 6.793,15"],
-        ["10/08", "CONTA LUZ", "€ 234,78 D", "€ 6.558,37"],
-        ["12/08", "NETFLIX.COM", "€ 39,90 D", "€ 6.518,47"],
-        ["15/08", "TRANSFERENCIA RECEBIDA", "€ 500,00 C", "€ 7.018,47"],
-        ["18/08", "POSTO SHELL", "€ 200,00 D", "€ 6.818,47"],
-        ["20/08", "ACADEMIA FITNESS", "€ 120,00 D", "€ 6.698,47"],
-        ["22/08", "PIX RECEBIDO PEDRO", "€ 80,00 C", "€ 6.778,47"],
-        ["25/08", "SHOPPING CENTER", "€ 450,00 D", "€ 6.328,47"],
-        ["28/08", "IFOOD", "€ 67,80 D", "€ 6.260,67"],
-        ["30/08", "RENDIMENTO POUPANCA", "€ 15,43 C", "€ 6.276,10"],
-    ]
-
-    # Helper to safely get a color: prefer named attribute if present, otherwise fall back to HexColor
-    def _safe_color(name, fallback_hex):
-        attr = getattr(colors, name, None)
-        if attr:
-            return attr
-        # Some reportlab fakes provide HexColor; others provide constants. Try HexColor when available.
-        hexfunc = getattr(colors, 'HexColor', None)
-        if callable(hexfunc):
-            return hexfunc(fallback_hex)
-        return fallback_hex
-
-    # Criar tabela de transações
-    trans_table = Table(transactions, colWidths=[50, 200, 80, 80])
-    trans_table.setStyle(TableStyle([
+    transactions_table_style = TableStyle([
         # Cabeçalho
-        ('BACKGROUND', (0, 0), (-1, 0), _safe_color('grey', '#808080')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), _safe_color('whitesmoke', '#F5F5F5')),
+        ('BACKGROUND', (0, 0), (-1, 0), grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), whitesmoke),
         ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
         ('FONTSIZE', (0, 0), (-1, 0), 10),
         ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
@@ -111,31 +77,110 @@ def create_sample_statement():
         ('ALIGN', (2, 1), (-1, -1), 'RIGHT'),
 
         # Linhas alternadas
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [_safe_color('white', '#FFFFFF'), _safe_color('lightgrey', '#D3D3D3')]),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, lightgrey]),
 
         # Bordas
-        ('GRID', (0, 0), (-1, -1), 0.5, _safe_color('black', '#000000')),
-    ]))
+        ('GRID', (0, 0), (-1, -1), 0.5, black),
+    ])
+
+    summary_table_style = TableStyle([
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ])
+
+    return SimpleNamespace(
+        A4=A4,
+        SimpleDocTemplate=SimpleDocTemplate,
+        Table=Table,
+        Paragraph=Paragraph,
+        Spacer=Spacer,
+        styles=styles,
+        title_style=title_style,
+        info_table_style=info_table_style,
+        transactions_table_style=transactions_table_style,
+        summary_table_style=summary_table_style,
+    )
+
+
+# Conteúdo fixo do extrato de exemplo, montado uma única vez no import
+_INFO_DATA = (
+    ("Agência:", "1234", "Conta:", "56789-0"),
+    ("Cliente:", "João da Silva", "CPF:", "123.456.789-00"),
+    ("Período:", "01/08/2025 a 31/08/2025", "", ""),
+)
+
+_TRANSACTIONS = (
+    ("Data", "Descrição", "Valor", "Saldo"),
+    ("01/08", "SALARIO EMPRESA XYZ", "€ 5.000,00 C", "€ 7.500,00"),
+    ("02/08", "PIX ENVIADO MARIA SILVA", "€ 150,00 D", "€ 7.350,00"),
+    ("03/08", "SUPERMERCADO EXTRA", "€ 287,45 D", "€ 7.062,55"),
+    ("05/08", "FARMACIA POPULAR", "€ 89,90 D", "€ 6.972,65"),
+    ("07/08", "UBER TRIP", "€ 23,50 D", "€ 6.949,15"),
+    ("08/08", "RESTAURANTE SABOR", "€ 156,00 D", "€ 6.793,15"),
+    ("10/08", "CONTA LUZ", "€ 234,78 D", "€ 6.558,37"),
+    ("12/08", "NETFLIX.COM", "€ 39,90 D", "€ 6.518,47"),
+    ("15/08", "TRANSFERENCIA RECEBIDA", "€ 500,00 C", "€ 7.018,47"),
+    ("18/08", "POSTO SHELL", "€ 200,00 D", "€ 6.818,47"),
+    ("20/08", "ACADEMIA FITNESS", "€ 120,00 D", "€ 6.698,47"),
+    ("22/08", "PIX RECEBIDO PEDRO", "€ 80,00 C", "€ 6.778,47"),
+    ("25/08", "SHOPPING CENTER", "€ 450,00 D", "€ 6.328,47"),
+    ("28/08", "IFOOD", "€ 67,80 D", "€ 6.260,67"),
+    ("30/08", "RENDIMENTO POUPANCA", "€ 15,43 C", "€ 6.276,10"),
+)
+
+_SUMMARY_DATA = (
+    ("Total de Créditos:", "€ 5.595,43"),
+    ("Total de Débitos:", "€ 1.819,33"),
+    ("Saldo Final:", "€ 6.276,10"),
+)
+
+
+def create_sample_statement():
+    """Cria um extrato bancário de exemplo em PDF."""
+
+    rl = _pdf_resources()
+
+    # Criar diretório se não existir
+    os.makedirs("data/samples", exist_ok=True)
+
+    # Nome do arquivo
+    filename = "data/samples/extrato_exemplo.pdf"
+
+    # Criar documento
+    doc = rl.SimpleDocTemplate(filename, pagesize=rl.A4)
+    story = []
+
+    # Cabeçalho
+    story.append(rl.Paragraph("BANCO EXEMPLO S.A.", rl.title_style))
+    story.append(rl.Spacer(1, 12))
+    story.append(rl.Paragraph("Extrato de Conta Corrente", rl.styles['Heading2']))
+    story.append(rl.Spacer(1, 12))
+
+    # Informações da conta
+    info_table = rl.Table(_INFO_DATA, colWidths=[60, 120, 60, 120])
+    info_table.setStyle(rl.info_table_style)
+
+    story.append(info_table)
+    story.append(rl.Spacer(1, 20))
+
+    # Saldo anterior
+    story.append(rl.Paragraph("Saldo Anterior (31/07/2025): € 2.500,00", rl.styles['Normal']))
+    story.append(rl.Spacer(1, 12))
+
+    # Transações
+    trans_table = rl.Table(_TRANSACTIONS, colWidths=[50, 200, 80, 80])
+    trans_table.setStyle(rl.transactions_table_style)
 
     story.append(trans_table)
-    story.append(Spacer(1, 20))
+    story.append(rl.Spacer(1, 20))
 
     # Resumo
-    story.append(Paragraph("RESUMO DO PERÍODO", styles['Heading3']))
-    story.append(Spacer(1, 12))
-
-    summary_data = [
-        ["Total de Créditos:", "€ 5.595,43"],
-        ["Total de Débitos:", "€ 1.819,33"],
-        ["Saldo Final:", "€ 6.276,10"]
-    ]
+    story.append(rl.Paragraph("RESUMO DO PERÍODO", rl.styles['Heading3']))
+    story.append(rl.Spacer(1, 12))
 
-    summary_table = Table(summary_data, colWidths=[150, 100])
-    summary_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-    ]))
+    summary_table = rl.Table(_SUMMARY_DATA, colWidths=[150, 100])
+    summary_table.setStyle(rl.summary_table_style)
 
     story.append(summary_table)
 
@@ -2,36 +2,63 @@
 """
 Script to examine the structure of the sample Excel file.
 """
-import pandas as pd
+from itertools import chain, islice
 from pathlib import Path
+from openpyxl import load_workbook
+
+PREVIEW_ROWS = 20
+NON_EMPTY_PREVIEW_ROWS = 10
+
+
+def _format_row(values):
+    """Format a row of cell values for display."""
+    return " | ".join("" if v is None else str(v) for v in values)
+
 
 def examine_excel_file(file_path):
     """Examine the structure of an Excel file."""
     print(f"Examining file: {file_path}")
-    
-    # Read all sheets
-    excel_file = pd.ExcelFile(file_path)
-    print(f"Sheet names: {excel_file.sheet_names}")
-    
-    # Read each sheet
-    for sheet_name in excel_file.sheet_names:
-        print(f"\n--- Sheet: {sheet_name} ---")
-        df = pd.read_excel(file_path, sheet_name=sheet_name)
-        print(f"Shape: {df.shape}")
-        print("Columns:")
-        for i, col in enumerate(df.columns):
-            print(f"  {i+1}. {col}")
-        print("\nFirst 20 rows:")
-        print(df.head(20))
-        print("\nData types:")
-        print(df.dtypes)
-        
-        # Check for non-empty rows
-        print("\nNon-empty rows:")
-        non_empty = df.dropna(how='all')
-        print(f"Total non-empty rows: {len(non_empty)}")
-        print("First 10 non-empty rows:")
-        print(non_empty.head(10))
+
+    # Read-only mode streams rows from the file instead of loading every cell
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        print(f"Sheet names: {workbook.sheetnames}")
+
+        for sheet in workbook.worksheets:
+            print(f"\n--- Sheet: {sheet.title} ---")
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, ())
+            preview = list(islice(rows, PREVIEW_ROWS))
+
+            n_rows = max((sheet.max_row or 1) - 1, len(preview))
+            n_cols = sheet.max_column or len(header)
+            print(f"Shape: ({n_rows}, {n_cols})")
+            print("Columns:")
+            for i, col in enumerate(header):
+                print(f"  {i+1}. {col}")
+            print(f"\nFirst {PREVIEW_ROWS} rows:")
+            for row in preview:
+                print(f"  {_format_row(row)}")
+            print("\nData types:")
+            for i, col in enumerate(header):
+                sample = next((row[i] for row in preview if i < len(row) and row[i] is not None), None)
+                print(f"  {col}: {type(sample).__name__ if sample is not None else 'empty'}")
+
+            # Check for non-empty rows (the rest of the sheet is streamed, not stored)
+            print("\nNon-empty rows:")
+            non_empty_count = 0
+            first_non_empty = []
+            for row in chain(preview, rows):
+                if any(v is not None for v in row):
+                    non_empty_count += 1
+                    if len(first_non_empty) < NON_EMPTY_PREVIEW_ROWS:
+                        first_non_empty.append(row)
+            print(f"Total non-empty rows: {non_empty_count}")
+            print(f"First {NON_EMPTY_PREVIEW_ROWS} non-empty rows:")
+            for row in first_non_empty:
+                print(f"  {_format_row(row)}")
+    finally:
+        workbook.close()
 
 if __name__ == "__main__":
     # Path to the sample Excel file
@@ -39,4 +66,4 @@ if __name__ == "__main__":
     if excel_path.exists():
         examine_excel_file(excel_path)
     else:
-        print(f"File not found: {excel_path}")
\ No newline at end of file
+        print(f"File not found: {excel_path}")
@@ -5,38 +5,205 @@ Script para calcular métricas de conformidade das regras do projeto.
 import os
 import sys
 import ast
+import hashlib
+import io
+import mmap
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple
-import subprocess
-import json
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+
+# Padrões usados nas varreduras, compilados uma única vez (sobre bytes: os
+# fontes não são decodificados)
+_LAYER_IMPORT_RE = re.compile(
+    rb'^\s*(?:from|import)\s+src\.(?:application|infrastructure|presentation)\b', re.MULTILINE
+)
+_HISTORY_DATE_RE = re.compile(rb'\[(\d{4})-(\d{2})-(\d{2})\]')
+
+# Cache de ASTs por arquivo: path -> (st_mtime_ns, árvore)
+_AST_CACHE: Dict[Path, Tuple[int, ast.AST]] = {}
+
+
+def _get_tree(path: Path, source: bytes) -> ast.AST:
+    """Retorna a AST do arquivo, reutilizando o parse enquanto o mtime não mudar."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _AST_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    tree = ast.parse(source, filename=str(path))
+    _AST_CACHE[path] = (mtime_ns, tree)
+    return tree
+
+
+# Cache da última cobertura medida, invalidado quando src/ ou tests/ mudam
+_COVERAGE_CACHE_FILE = ".metrics_cache.json"
+
+# Diretórios ignorados na varredura de fontes
+_SKIP_DIRS = frozenset({'__pycache__', '.git'})
+
+
+def _iter_py(root: str):
+    """Gera os caminhos (str) dos arquivos .py sob root usando os.scandir."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        yield entry.path
+        except FileNotFoundError:
+            continue
+
+
+# Nós em que classes podem aparecer: só comandos são visitados, nunca expressões
+# (ast.match_case só existe a partir do Python 3.10)
+_CLASS_CONTAINERS = (ast.stmt, ast.excepthandler) + ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+
+
+def _iter_classes(tree: ast.AST):
+    """Gera as classes da árvore sem descer em expressões, que são a maior parte dos nós."""
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                yield child
+            if isinstance(child, _CLASS_CONTAINERS):
+                stack.append(child)
+
+
+# Penalidades a partir das quais o score DRY/KISS já está no piso (min(30, n*2) e
+# min(50, n*5)); contar além disso não altera o resultado
+_DUP_PENALTY_CAP = 15
+_COMPLEX_FUNCTIONS_CAP = 10
+
+# Ranks do radon considerados complexos (equivalente a --min B)
+_COMPLEX_RANKS = frozenset('BCDEF')
+
+# Abaixo deste número de arquivos o custo de subir os processos supera o ganho
+_PARALLEL_MIN_FILES = 32
+
+
+def _analyze_file(item: Tuple[str, bytes, bool]) -> Dict[str, int]:
+    """Coleta, numa única passada, as contagens por arquivo usadas pelos scores.
+
+    Recebe (caminho, conteúdo, pertence_ao_domínio). Fica no nível do módulo para
+    poder ser enviada aos processos do ProcessPoolExecutor.
+    """
+    path_str, content, is_domain = item
+    path = Path(path_str)
+    stats = {'ca_viol': 0, 'solid_viol': 0, 'class_count': 0, 'dup_penalty': 0}
+    if path.name == "__init__.py":
+        return stats
+    
+    # Clean Architecture: imports de outras camadas dentro do domínio
+    if is_domain and _LAYER_IMPORT_RE.search(content):
+        stats['ca_viol'] = 1
+    
+    # SOLID: classes com muitos métodos (SRP) ou muitos métodos públicos (ISP)
+    try:
+        tree = _get_tree(path, content)
+        for node in _iter_classes(tree):
+            stats['class_count'] += 1
+            methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
+            if len(methods) > 10:
+                stats['solid_viol'] += 1
+            public_methods = [m for m in methods if not m.name.startswith('_')]
+            if len(public_methods) > 5:
+                stats['solid_viol'] += 1
+    except Exception:
+        pass
+    
+    # DRY: cada reaparição de uma linha significativa já vista no arquivo,
+    # interrompendo a varredura quando a penalidade satura
+    seen = set()
+    for line in content.split(b'\n'):
+        stripped = line.strip()
+        if len(stripped) > 20:  # Linhas significativas
+            if stripped in seen:
+                stats['dup_penalty'] += 1
+                if stats['dup_penalty'] >= _DUP_PENALTY_CAP:
+                    break
+            else:
+                seen.add(stripped)
+    return stats
+
+
+def _status(score: float) -> str:
+    """Ícone de status do dashboard para um score."""
+    return '✅' if score >= 80 else ('⚠️' if score >= 60 else '❌')
+
 
 class ConformityMetrics:
     """Calculadora de métricas de conformidade."""
     
+    # Chave em self.metrics -> método que calcula o valor
+    SCORE_CALCULATORS = {
+        'clean_architecture_score': 'calculate_clean_architecture_score',
+        'solid_score': 'calculate_solid_score',
+        'dry_kiss_score': 'calculate_dry_kiss_score',
+        'testing_score': 'calculate_testing_score',
+        'dev_history_score': 'calculate_dev_history_score',
+        'overall_score': 'calculate_overall_score',
+    }
+    
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root)
         self.metrics = {}
+        self._sources: Dict[Path, bytes] = {}
+        self._file_stats: Optional[Dict[str, int]] = None
+    
+    def _load_sources(self) -> Dict[Path, bytes]:
+        """Lê uma única vez, em bytes, todos os arquivos .py de src/ e reutiliza o conteúdo entre as métricas."""
+        if not self._sources:
+            for path_str in _iter_py(str(self.project_root / "src")):
+                with open(path_str, 'rb') as f:
+                    self._sources[Path(path_str)] = f.read()
+        return self._sources
+    
+    def _collect_file_stats(self) -> Dict[str, int]:
+        """Agrega as contagens de todos os arquivos de src/, analisados uma única vez.
+
+        Com muitos arquivos a análise é distribuída entre processos; em projetos
+        pequenos roda em série no próprio processo.
+        """
+        if self._file_stats is not None:
+            return self._file_stats
+        
+        domain_dir = self.project_root / "src" / "domain"
+        items = [(str(p), c, domain_dir in p.parents) for p, c in self._load_sources().items()]
+        
+        totals = {'ca_viol': 0, 'solid_viol': 0, 'class_count': 0, 'dup_penalty': 0,
+                  'domain_files': sum(1 for item in items if item[2])}
+        if len(items) >= _PARALLEL_MIN_FILES:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(_analyze_file, items, chunksize=16))
+        else:
+            results = [_analyze_file(item) for item in items]
+        for stats in results:
+            for key, value in stats.items():
+                totals[key] += value
+        
+        self._file_stats = totals
+        return totals
+    
+    def _get_score(self, key: str) -> float:
+        """Retorna o score já registrado em self.metrics, calculando-o só se ausente."""
+        if key in self.metrics:
+            return self.metrics[key]
+        return getattr(self, self.SCORE_CALCULATORS[key])()
     
     def calculate_clean_architecture_score(self) -> float:
         """Calcula score de conformidade com Clean Architecture."""
-        domain_files = list(self.project_root.glob("src/domain/**/*.py"))
-        total_files = len(domain_files)
-        violations = 0
-        
-        for file_path in domain_files:
-            if file_path.name == "__init__.py":
-                continue
-                
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Verificar imports de outras camadas
-            if re.search(r'from src\.(application|infrastructure|presentation)', content):
-                violations += 1
-            if re.search(r'import src\.(application|infrastructure|presentation)', content):
-                violations += 1
+        stats = self._collect_file_stats()
+        total_files = stats['domain_files']
+        violations = stats['ca_viol']
         
         if total_files == 0:
             return 100.0
@@ -47,35 +214,12 @@ class ConformityMetrics:
     
     def calculate_solid_score(self) -> float:
         """Calcula score de conformidade com princípios SOLID."""
-        total_classes = 0
-        violations = 0
+        if 'solid_score' in self.metrics:
+            return self.metrics['solid_score']
         
-        for file_path in self.project_root.glob("src/**/*.py"):
-            if file_path.name == "__init__.py":
-                continue
-                
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef):
-                        total_classes += 1
-                        methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
-                        
-                        # SRP: Classes com muitos métodos
-                        if len(methods) > 10:
-                            violations += 1
-                        
-                        # ISP: Classes com muitos métodos públicos
-                        public_methods = [m for m in methods if not m.name.startswith('_')]
-                        if len(public_methods) > 5:
-                            violations += 1
-                
-            except Exception:
-                continue
+        stats = self._collect_file_stats()
+        total_classes = stats['class_count']
+        violations = stats['solid_viol']
         
         if total_classes == 0:
             return 100.0
@@ -88,34 +232,31 @@ class ConformityMetrics:
         """Calcula score de conformidade com DRY/KISS/YAGNI."""
         score = 100.0
         
+        # Imports adiados: só este score executa o radon e lê JSON
+        import json
+        import subprocess
+        
         # Verificar complexidade ciclomática
         try:
-            result = subprocess.run(['radon', 'cc', 'src/', '--min', 'B'], 
-                                  capture_output=True, text=True, timeout=30)
+            result = subprocess.run(['radon', 'cc', 'src/', '-j', '--min', 'B'], 
+                                  capture_output=True, timeout=30)
             if result.returncode == 0:
-                complex_functions = len([line for line in result.stdout.split('\n') if 'B' in line or 'C' in line or 'D' in line])
+                # Saída JSON: caminho -> lista de blocos (ou {"error": ...} se o arquivo falhar);
+                # json.loads recebe os bytes capturados, sem decodificação prévia
+                complex_functions = 0
+                for blocks in json.loads(result.stdout or b'{}').values():
+                    if not isinstance(blocks, list):
+                        continue
+                    complex_functions += sum(1 for block in blocks if block.get('rank') in _COMPLEX_RANKS)
+                    if complex_functions >= _COMPLEX_FUNCTIONS_CAP:
+                        break
                 if complex_functions > 0:
                     score -= min(50, complex_functions * 5)  # Penalizar funções complexas
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
             pass
         
         # Verificar duplicação (simulação)
-        duplicate_penalty = 0
-        for file_path in self.project_root.glob("src/**/*.py"):
-            if file_path.name == "__init__.py":
-                continue
-                
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Detectar padrões de duplicação simples
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
-                if len(line.strip()) > 20:  # Linhas significativas
-                    for j, other_line in enumerate(lines[i+1:], i+1):
-                        if line.strip() == other_line.strip() and len(line.strip()) > 10:
-                            duplicate_penalty += 1
-                            break
+        duplicate_penalty = self._collect_file_stats()['dup_penalty']
         
         score -= min(30, duplicate_penalty * 2)
         
@@ -124,20 +265,108 @@ class ConformityMetrics:
     
     def calculate_testing_score(self) -> float:
         """Calcula score de conformidade com política de testes."""
+        if 'testing_score' not in self.metrics:
+            coverage_percent = self._measure_coverage()
+            if coverage_percent is not None:
+                self.metrics['test_coverage'] = coverage_percent
+            # Registra também a falha (0.0) para não repetir a execução da suíte
+            self.metrics['testing_score'] = coverage_percent if coverage_percent is not None else 0.0
+        return self.metrics['testing_score']
+    
+    def _measure_coverage(self) -> Optional[int]:
+        """Obtém o percentual de cobertura de src/, rodando os testes só se o cache estiver desatualizado."""
+        # Código e testes inalterados desde a última medição: usa o valor persistido
+        tree_hash = self._source_tree_hash()
+        cached = self._load_coverage_cache()
+        if cached.get('src_hash') == tree_hash and isinstance(cached.get('coverage'), int):
+            return cached['coverage']
+        
+        # Só confia no que foi medido aqui, com a suíte completa de tests/unit/; o
+        # .coverage do projeto pode vir de uma execução parcial ou com falhas
+        coverage_percent = self._run_coverage_suite()
+        if coverage_percent is not None:
+            self._save_coverage_cache(tree_hash, coverage_percent)
+        return coverage_percent
+    
+    def _source_files(self) -> List[str]:
+        """Caminhos dos .py de src/ e tests/, em ordem estável."""
+        return [
+            path_str
+            for directory in ("src", "tests")
+            for path_str in sorted(_iter_py(str(self.project_root / directory)))
+        ]
+    
+    def _run_coverage_suite(self) -> Optional[int]:
+        """Roda a suíte num subprocesso e lê a cobertura de src/ do arquivo de dados gerado.
+
+        O subprocesso isola os monkeypatches e imports dos testes deste processo, e
+        COVERAGE_FILE aponta para um diretório temporário para não sobrescrever o
+        .coverage do projeto.
+        """
+        import subprocess
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_file = Path(tmp_dir) / ".coverage"
+            env = dict(os.environ, COVERAGE_FILE=str(data_file))
+            try:
+                result = subprocess.run(
+                    [sys.executable, '-m', 'pytest', 'tests/unit/', '--cov=src', '--cov-report=', '-q'],
+                    cwd=str(self.project_root), env=env,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60,
+                )
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                return None
+            if result.returncode != 0:
+                return None
+            return self._read_coverage_total(data_file)
+    
+    def _source_tree_hash(self) -> str:
+        """Hash dos caminhos e mtimes dos .py de src/ e tests/, usado para invalidar o cache."""
+        digest = hashlib.blake2b(digest_size=16)
+        for path_str in self._source_files():
+            digest.update(f"{path_str}:{os.stat(path_str).st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+    
+    def _load_coverage_cache(self) -> dict:
+        """Lê o cache de cobertura; ausente ou corrompido equivale a vazio."""
+        import json
+        
         try:
-            result = subprocess.run(['python', '-m', 'pytest', 'tests/unit/', '--cov=src', '--cov-report=term-missing'], 
-                                  capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                coverage_match = re.search(r'TOTAL\s+(\d+)\s+(\d+)\s+(\d+)%', result.stdout)
-                if coverage_match:
-                    coverage_percent = int(coverage_match.group(3))
-                    self.metrics['test_coverage'] = coverage_percent
-                    return coverage_percent
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+            with open(self.project_root / _COVERAGE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cached if isinstance(cached, dict) else {}
+    
+    def _save_coverage_cache(self, tree_hash: str, coverage_percent: int) -> None:
+        """Grava o cache de cobertura de forma atômica (arquivo temporário + os.replace)."""
+        import json
+        
+        cache_file = self.project_root / _COVERAGE_CACHE_FILE
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'src_hash': tree_hash, 'coverage': coverage_percent}, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
             pass
+    
+    def _read_coverage_total(self, data_file: Path) -> Optional[int]:
+        """Lê do arquivo de dados do coverage o percentual total de cobertura de src/."""
+        if not data_file.exists():
+            return None
         
-        return 0.0
+        try:
+            import coverage
+            
+            cov = coverage.Coverage(data_file=str(data_file))
+            cov.load()
+            total = cov.report(file=io.StringIO(), include=[str(self.project_root.resolve() / "src" / "*")])
+        except Exception:
+            return None
+        
+        return round(total)
     
     def calculate_dev_history_score(self) -> float:
         """Calcula score de conformidade com histórico de desenvolvimento."""
@@ -145,36 +374,39 @@ class ConformityMetrics:
         if not history_file.exists():
             return 0.0
         
-        with open(history_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Verificar se há entradas recentes (últimos 30 dias), percorrendo o
+        # arquivo mapeado em memória em vez de carregá-lo numa string
+        cutoff = date.today() - timedelta(days=30)
+        total_entries = 0
+        valid_entries = 0
+        with open(history_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0.0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                for match in _HISTORY_DATE_RE.finditer(content):
+                    total_entries += 1
+                    try:
+                        entry_date = date(int(match[1]), int(match[2]), int(match[3]))
+                    except ValueError:
+                        continue
+                    if entry_date >= cutoff:
+                        valid_entries += 1
         
-        # Verificar se há entradas recentes (últimos 30 dias)
-        entries = re.findall(r'\[(\d{4}-\d{2}-\d{2})\]', content)
-        if not entries:
+        if not total_entries:
             return 0.0
         
-        # Verificar formato das entradas
-        valid_entries = 0
-        for entry in entries:
-            try:
-                entry_date = datetime.strptime(entry, '%Y-%m-%d')
-                if (datetime.now() - entry_date).days <= 30:
-                    valid_entries += 1
-            except ValueError:
-                continue
-        
-        score = min(100, (valid_entries / max(1, len(entries))) * 100)
+        score = min(100, (valid_entries / total_entries) * 100)
         self.metrics['dev_history_score'] = score
         return score
     
     def calculate_overall_score(self) -> float:
         """Calcula score geral de conformidade."""
         scores = [
-            self.calculate_clean_architecture_score(),
-            self.calculate_solid_score(),
-            self.calculate_dry_kiss_score(),
-            self.calculate_testing_score(),
-            self.calculate_dev_history_score()
+            self._get_score('clean_architecture_score'),
+            self._get_score('solid_score'),
+            self._get_score('dry_kiss_score'),
+            self._get_score('testing_score'),
+            self._get_score('dev_history_score')
         ]
         
         overall_score = sum(scores) / len(scores)
@@ -192,21 +424,28 @@ class ConformityMetrics:
         dashboard.append("## 🎯 Scores de Conformidade")
         dashboard.append("")
         
-        ca_score = self.calculate_clean_architecture_score()
-        solid_score = self.calculate_solid_score()
-        dry_kiss_score = self.calculate_dry_kiss_score()
-        testing_score = self.calculate_testing_score()
-        history_score = self.calculate_dev_history_score()
-        overall_score = self.calculate_overall_score()
-        
-        dashboard.append(f"| Regra | Score | Status |")
-        dashboard.append(f"|-------|-------|--------|")
-        dashboard.append(f"| 🏗️ Clean Architecture | {ca_score:.1f}% | {'✅' if ca_score >= 80 else '⚠️' if ca_score >= 60 else '❌'} |")
-        dashboard.append(f"| 🔧 SOLID | {solid_score:.1f}% | {'✅' if solid_score >= 80 else '⚠️' if solid_score >= 60 else '❌'} |")
-        dashboard.append(f"| 🎯 DRY/KISS/YAGNI | {dry_kiss_score:.1f}% | {'✅' if dry_kiss_score >= 80 else '⚠️' if dry_kiss_score >= 60 else '❌'} |")
-        dashboard.append(f"| 🧪 Testes | {testing_score:.1f}% | {'✅' if testing_score >= 80 else '⚠️' if testing_score >= 60 else '❌'} |")
-        dashboard.append(f"| 📝 Histórico | {history_score:.1f}% | {'✅' if history_score >= 80 else '⚠️' if history_score >= 60 else '❌'} |")
-        dashboard.append(f"| **📈 GERAL** | **{overall_score:.1f}%** | **{'✅' if overall_score >= 80 else '⚠️' if overall_score >= 60 else '❌'}** |")
+        ca_score = self._get_score('clean_architecture_score')
+        solid_score = self._get_score('solid_score')
+        dry_kiss_score = self._get_score('dry_kiss_score')
+        testing_score = self._get_score('testing_score')
+        history_score = self._get_score('dev_history_score')
+        overall_score = self._get_score('overall_score')
+        
+        # (rótulo da tabela, rótulo detalhado, score); os detalhes omitem Testes,
+        # exibidos como cobertura
+        rows = [
+            ("🏗️ Clean Architecture", "Score Clean Architecture", ca_score),
+            ("🔧 SOLID", "Score SOLID", solid_score),
+            ("🎯 DRY/KISS/YAGNI", "Score DRY/KISS/YAGNI", dry_kiss_score),
+            ("🧪 Testes", None, testing_score),
+            ("📝 Histórico", "Score Histórico", history_score),
+        ]
+        
+        dashboard.append("| Regra | Score | Status |")
+        dashboard.append("|-------|-------|--------|")
+        for name, _, score in rows:
+            dashboard.append(f"| {name} | {score:.1f}% | {_status(score)} |")
+        dashboard.append(f"| **📈 GERAL** | **{overall_score:.1f}%** | **{_status(overall_score)}** |")
         dashboard.append("")
         
         # Métricas detalhadas
@@ -216,10 +455,9 @@ class ConformityMetrics:
         if 'test_coverage' in self.metrics:
             dashboard.append(f"- **Cobertura de Testes**: {self.metrics['test_coverage']}%")
         
-        dashboard.append(f"- **Score Clean Architecture**: {ca_score:.1f}%")
-        dashboard.append(f"- **Score SOLID**: {solid_score:.1f}%")
-        dashboard.append(f"- **Score DRY/KISS/YAGNI**: {dry_kiss_score:.1f}%")
-        dashboard.append(f"- **Score Histórico**: {history_score:.1f}%")
+        for _, detail, score in rows:
+            if detail:
+                dashboard.append(f"- **{detail}**: {score:.1f}%")
         dashboard.append("")
         
         # Recomendações
@@ -249,21 +487,37 @@ class ConformityMetrics:
         
         return "\n".join(dashboard)
     
-    def save_metrics_json(self, filename: str = "metrics.json"):
-        """Salva métricas em formato JSON."""
+    def save_metrics_json(self, filename: str = "metrics.json", pretty: bool = True):
+        """Salva métricas em formato JSON (indentado, ou compacto com pretty=False)."""
         metrics_data = {
             'timestamp': datetime.now().isoformat(),
-            'clean_architecture_score': self.calculate_clean_architecture_score(),
-            'solid_score': self.calculate_solid_score(),
-            'dry_kiss_score': self.calculate_dry_kiss_score(),
-            'testing_score': self.calculate_testing_score(),
-            'dev_history_score': self.calculate_dev_history_score(),
-            'overall_score': self.calculate_overall_score(),
+            'clean_architecture_score': self._get_score('clean_architecture_score'),
+            'solid_score': self._get_score('solid_score'),
+            'dry_kiss_score': self._get_score('dry_kiss_score'),
+            'testing_score': self._get_score('testing_score'),
+            'dev_history_score': self._get_score('dev_history_score'),
+            'overall_score': self._get_score('overall_score'),
             'metrics': self.metrics
         }
         
+        # orjson (opcional) serializa numa única chamada em C, já em UTF-8
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            Path(filename).write_bytes(orjson.dumps(metrics_data, option=option))
+            return
+        
+        import json
+        
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(metrics_data, f, indent=2, ensure_ascii=False)
+            if pretty:
+                json.dump(metrics_data, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(metrics_data, f, separators=(',', ':'), ensure_ascii=False)
 
 def main():
     """Função principal."""
@@ -3,10 +3,15 @@
 Script de teste para o leitor de Excel.
 """
 import sys
+from collections import deque
+from itertools import islice
 from pathlib import Path
 
-# Adiciona o diretório raiz ao path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Adiciona o diretório raiz ao path apenas quando executado como arquivo solto
+# (python scripts/test_excel_reader.py); via "python -m" ou pytest ele já está lá
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.infrastructure.readers.excel_reader import ExcelStatementReader
 from src.domain.models import TransactionType
@@ -30,25 +35,35 @@ def test_excel_reader():
         return
     
     try:
-        # Lê o extrato
-        statement = reader.read(excel_path)
+        # Percorre as transações uma única vez, guardando só as 5 primeiras e as 5 últimas
+        transactions = reader.read_iter(excel_path)
+        first = list(islice(transactions, 5))
+        last = deque(first, maxlen=5)
+        total = len(first)
+        period_start = min((t.date for t in first), default=None)
+        period_end = max((t.date for t in first), default=None)
+        for transaction in transactions:
+            last.append(transaction)
+            total += 1
+            period_start = min(period_start, transaction.date)
+            period_end = max(period_end, transaction.date)
         
+        # Banco e conta vêm do preâmbulo lido por read_iter; os saldos exigiriam
+        # percorrer a planilha inteira como read() e não são exibidos
         print(f"\nExtrato lido com sucesso!")
-        print(f"Banco: {statement.bank_name}")
-        print(f"Conta: {statement.account_number}")
-        print(f"Período: {statement.period_start} a {statement.period_end}")
-        print(f"Saldo inicial: € {statement.initial_balance}")
-        print(f"Saldo final: € {statement.final_balance}")
-        print(f"Total de transações: {len(statement.transactions)}")
+        print(f"Banco: {reader.bank_name}")
+        print(f"Conta: {reader.account_number}")
+        print(f"Período: {period_start} a {period_end}")
+        print(f"Total de transações: {total}")
         
         print(f"\nPrimeiras 5 transações:")
-        for i, transaction in enumerate(statement.transactions[:5]):
+        for i, transaction in enumerate(first):
             print(f"  {i+1}. {transaction.date.strftime('%d/%m/%Y')} - "
                   f"{transaction.description} - "
                   f"{'+' if transaction.type == TransactionType.CREDIT else '-'}€ {transaction.amount}")
         
         print(f"\nÚltimas 5 transações:")
-        for i, transaction in enumerate(statement.transactions[-5:], len(statement.transactions)-4):
+        for i, transaction in enumerate(last, total - len(last) + 1):
             print(f"  {i}. {transaction.date.strftime('%d/%m/%Y')} - "
                   f"{transaction.description} - "
                   f"{'+' if transaction.type == TransactionType.CREDIT else '-'}€ {transaction.amount}")
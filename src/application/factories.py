@@ -1,6 +1,12 @@
 """
 Factories para criação de componentes do sistema.
+
+Os componentes sem estado (analisador e gerador de relatórios) são construídos uma
+única vez por processo (``lru_cache``) e reutilizados nas chamadas seguintes. Os
+leitores guardam estado por leitura (moeda, banco, métricas) e o categorizador tem
+palavras-chave editáveis (add_keyword), por isso são sempre instâncias novas.
 """
+from functools import lru_cache
 from typing import List
 from src.domain.interfaces import (
     StatementReader,
@@ -10,39 +16,71 @@ from src.domain.interfaces import (
 )
 
 
+def create_pdf_reader() -> StatementReader:
+    """Cria o leitor de extratos em PDF."""
+    from src.infrastructure.readers.pdf_reader import PDFStatementReader
+    return PDFStatementReader()
+
+
+def create_excel_reader() -> StatementReader:
+    """Cria o leitor de extratos em Excel."""
+    from src.infrastructure.readers.excel_reader import ExcelStatementReader
+    return ExcelStatementReader()
+
+
+def create_csv_reader() -> StatementReader:
+    """Cria o leitor de extratos em CSV."""
+    from src.infrastructure.readers.csv_reader import CSVStatementReader
+    return CSVStatementReader()
+
+
+def create_readers() -> List[StatementReader]:
+    """Cria todos os leitores disponíveis (PDF, Excel, CSV)."""
+    return [create_pdf_reader(), create_excel_reader(), create_csv_reader()]
+
+
+def create_categorizer() -> TransactionCategorizer:
+    """Cria o categorizador de transações."""
+    from src.infrastructure.categorizers.keyword_categorizer import KeywordCategorizer
+    return KeywordCategorizer()
+
+
+@lru_cache(maxsize=1)
+def create_analyzer() -> StatementAnalyzer:
+    """Cria o analisador de extratos."""
+    from src.infrastructure.analyzers.basic_analyzer import BasicStatementAnalyzer
+    return BasicStatementAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def create_report_generator() -> ReportGenerator:
+    """Cria o gerador de relatórios."""
+    from src.infrastructure.reports.text_report import TextReportGenerator
+    return TextReportGenerator()
+
+
 class ComponentFactory:
     """Factory para criação de componentes do sistema."""
     
     @staticmethod
     def create_readers() -> List[StatementReader]:
         """Cria todos os leitores disponíveis."""
-        from src.infrastructure.readers.pdf_reader import PDFStatementReader
-        from src.infrastructure.readers.excel_reader import ExcelStatementReader
-        from src.infrastructure.readers.csv_reader import CSVStatementReader
-        
-        return [
-            PDFStatementReader(),
-            ExcelStatementReader(),
-            CSVStatementReader()
-        ]
+        return create_readers()
     
     @staticmethod
     def create_categorizer() -> TransactionCategorizer:
         """Cria o categorizador de transações."""
-        from src.infrastructure.categorizers.keyword_categorizer import KeywordCategorizer
-        return KeywordCategorizer()
+        return create_categorizer()
     
     @staticmethod
     def create_analyzer() -> StatementAnalyzer:
-        """Cria o analisador de extratos."""
-        from src.infrastructure.analyzers.basic_analyzer import BasicStatementAnalyzer
-        return BasicStatementAnalyzer()
+        """Retorna o analisador de extratos."""
+        return create_analyzer()
     
     @staticmethod
     def create_report_generator() -> ReportGenerator:
-        """Cria o gerador de relatórios."""
-        from src.infrastructure.reports.text_report import TextReportGenerator
-        return TextReportGenerator()
+        """Retorna o gerador de relatórios."""
+        return create_report_generator()
     
     @staticmethod
     def get_appropriate_reader(file_path: str, readers: List[StatementReader]) -> StatementReader:
@@ -27,6 +27,8 @@ class AnalyzeStatementUseCase:
         self.categorizer = categorizer
         self.analyzer = analyzer
         self.report_generator = report_generator
+        # Extrato lido pela última execução, para quem precisar dele sem reler o arquivo
+        self.last_statement: Optional[BankStatement] = None
 
     def execute(
         self,
@@ -43,10 +45,10 @@ class AnalyzeStatementUseCase:
 
         # Lê o extrato
         statement = self.reader.read(file_path)
+        self.last_statement = statement
 
-        # Categoriza as transações
-        for i, transaction in enumerate(statement.transactions):
-            statement.transactions[i] = self.categorizer.categorize(transaction)
+        # Categoriza as transações em lote
+        statement.transactions = self.categorizer.categorize_batch(statement.transactions)
 
         # Analisa o extrato
         analysis_result = self.analyzer.analyze(statement)
@@ -57,6 +59,33 @@ class AnalyzeStatementUseCase:
         return analysis_result, report
 
 
+# Classe do gerador de relatório em texto, resolvida na primeira análise
+_TEXT_REPORT_CLS = None
+
+
+class _FallbackTextReportGenerator(ReportGenerator):
+    """Gerador mínimo usado quando a implementação concreta não pode ser importada."""
+
+    def generate(self, analysis, output_path: Optional[Path] = None) -> str:
+        # Retorna um relatório mínimo vazio; isso permite que a fachada e os
+        # use-cases funcionem em ambientes de teste que não expõem a
+        # implementação real.
+        return ""
+
+
+class LazyReportGenerator:
+    """Gerador de relatório "lazy" que delega para o TextReportGenerator da fachada."""
+
+    __slots__ = ('_parent',)
+
+    def __init__(self, parent: "ExtractAnalyzer"):
+        self._parent = parent
+
+    def generate(self, analysis, output_path: Optional[Path] = None) -> str:
+        real = self._parent._get_text_report_generator()
+        return real.generate(analysis, output_path)
+
+
 class ExtractAnalyzer:
     """Classe de fachada para simplificar o uso do sistema."""
 
@@ -67,19 +96,17 @@ class ExtractAnalyzer:
         self.readers = ComponentFactory.create_readers()
         self.categorizer = ComponentFactory.create_categorizer()
         self.analyzer = ComponentFactory.create_analyzer()
+
+        # Extensão -> leitor, para escolher o leitor sem chamar can_read de cada um
+        self._ext_map = {
+            ext: reader
+            for reader in reversed(self.readers)
+            for ext in getattr(reader, 'SUPPORTED_EXTENSIONS', ())
+        }
         
         # Inicialização "lazy" do gerador de relatório
         self.text_report = None
 
-        # Cria um gerador de relatório "lazy" que delega para o TextReportGenerator
-        class LazyReportGenerator:
-            def __init__(self, parent):
-                self._parent = parent
-
-            def generate(self, analysis, output_path: Optional[Path] = None) -> str:
-                real = self._parent._get_text_report_generator()
-                return real.generate(analysis, output_path)
-
         # Cria caso de uso com o primeiro leitor (será substituído dinamicamente)
         self.use_case = AnalyzeStatementUseCase(
             reader=self.readers[0],  # PDF reader por padrão
@@ -90,6 +117,10 @@ class ExtractAnalyzer:
 
     def _get_appropriate_reader(self, file_path: str) -> StatementReader:
         """Retorna o leitor apropriado para o tipo de arquivo."""
+        reader = self._ext_map.get(Path(file_path).suffix.lower())
+        if reader is not None:
+            return reader
+        # Leitores sem extensões declaradas ainda são consultados via can_read
         from src.application.factories import ComponentFactory
         return ComponentFactory.get_appropriate_reader(file_path, self.readers)
 
@@ -109,8 +140,9 @@ class ExtractAnalyzer:
         else:
             self.use_case.report_generator = self.text_report
 
+        # O extrato já lido pelo caso de uso é devolvido, sem reler o arquivo
         result, report = self.use_case.execute(file_path, output_path)
-        return result, report, reader.read(Path(file_path))
+        return result, report, self.use_case.last_statement
 
     def analyze_and_print(self, file_path: str):
         result, report, statement = self.analyze_file(file_path)
@@ -126,35 +158,18 @@ class ExtractAnalyzer:
         if self.text_report is not None:
             return self.text_report
 
-        # Importa apenas aqui para reduzir risco de import circular/ordem
-        from importlib import import_module
-
-        # Tenta importar o módulo e obter a classe de forma resiliente
-        try:
-            module = import_module('src.infrastructure.reports.text_report')
-            TextReportGenerator = getattr(module, 'TextReportGenerator', None)
-            if TextReportGenerator is None:
-                # Tenta obter do package em caso de monkeypatch que exponha a classe lá
-                pkg = import_module('src.infrastructure.reports')
-                TextReportGenerator = getattr(pkg, 'TextReportGenerator', None)
-            if TextReportGenerator is None:
-                # Tenta import direto (ponto final)
-                from src.infrastructure.reports.text_report import TextReportGenerator as TRG
-                TextReportGenerator = TRG
-        except Exception as e:
-            # Se não for possível importar a implementação concreta do gerador
-            # de relatórios (por exemplo, em testes que monkeypatcham módulos),
-            # fornecemos um gerador fallback simples que respeita a interface.
-            class FallbackTextReportGenerator(ReportGenerator):
-                def generate(self, analysis, output_path: Optional[Path] = None) -> str:
-                    # Retorna um relatório mínimo vazio; isso permite que a
-                    # fachada e os use-cases funcionem em ambientes de teste
-                    # que não expõem a implementação real.
-                    return ""
-
-            self.text_report = FallbackTextReportGenerator()
-            return self.text_report
-
-        # Se a importação foi bem-sucedida, instancia o gerador real abaixo
-        self.text_report = TextReportGenerator()
-        return self.text_report
\ No newline at end of file
+        global _TEXT_REPORT_CLS
+        if _TEXT_REPORT_CLS is None:
+            # Importa apenas aqui para reduzir risco de import circular/ordem
+            try:
+                from src.infrastructure.reports.text_report import TextReportGenerator
+            except Exception:
+                # Sem a implementação concreta (por exemplo, em testes que fazem
+                # monkeypatch do módulo) usa o fallback, sem guardá-lo em cache
+                # para que uma chamada posterior ainda possa obter a classe real
+                self.text_report = _FallbackTextReportGenerator()
+                return self.text_report
+            _TEXT_REPORT_CLS = TextReportGenerator
+
+        self.text_report = _TEXT_REPORT_CLS()
+        return self.text_report
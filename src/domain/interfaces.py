@@ -46,4 +46,13 @@ class TransactionCategorizer(ABC):
     @abstractmethod
     def categorize(self, transaction: Transaction) -> Transaction:
         """Categoriza uma transação."""
-        pass
\ No newline at end of file
+        pass
+
+    def categorize_batch(self, transactions: List[Transaction]) -> List[Transaction]:
+        """Categoriza uma lista de transações, mantendo a ordem.
+
+        Implementações podem sobrescrever para preparar seus dados uma única vez
+        por lote.
+        """
+        categorize = self.categorize
+        return [categorize(transaction) for transaction in transactions]
\ No newline at end of file
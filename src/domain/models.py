@@ -5,10 +5,21 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from uuid import uuid4
 
 
+def cents_to_decimal(cents: int) -> Decimal:
+    """Converte um valor inteiro em centavos para Decimal com duas casas."""
+    return Decimal(cents).scaleb(-2)
+
+
+def exact_cents(amount: Decimal) -> Optional[int]:
+    """Valor em centavos inteiros, ou None se o amount tiver frações de centavo."""
+    cents = amount.scaleb(2)
+    return int(cents) if cents == cents.to_integral_value() else None
+
+
 class TransactionType(Enum):
     """Tipos de transação bancária."""
     DEBIT = "DEBIT"
@@ -51,6 +62,11 @@ class Transaction:
         if self.balance_after and isinstance(self.balance_after, (int, float)):
             self.balance_after = Decimal(str(self.balance_after))
             
+    @property
+    def amount_cents(self) -> int:
+        """Valor em centavos (inteiro, arredondado), sempre derivado do amount atual."""
+        return int(self.amount.scaleb(2).to_integral_value())
+    
     @property
     def is_income(self) -> bool:
         """Verifica se é uma receita."""
@@ -83,21 +99,23 @@ class BankStatement:
         if isinstance(self.final_balance, (int, float)):
             self.final_balance = Decimal(str(self.final_balance))
     
+    def _sum_amounts(self, transactions: Iterable[Transaction]) -> Decimal:
+        """Soma exata dos valores: em centavos inteiros, ou em Decimal se houver frações de centavo."""
+        amounts = [t.amount for t in transactions]
+        cents = [exact_cents(a) for a in amounts]
+        if None in cents:
+            return sum(amounts, Decimal("0"))
+        return cents_to_decimal(sum(cents))
+    
     @property
     def total_income(self) -> Decimal:
         """Calcula o total de receitas."""
-        return sum(
-            t.amount for t in self.transactions 
-            if t.is_income
-        )
+        return self._sum_amounts(t for t in self.transactions if t.is_income)
     
     @property
     def total_expenses(self) -> Decimal:
         """Calcula o total de despesas."""
-        return sum(
-            t.amount for t in self.transactions 
-            if t.is_expense
-        )
+        return self._sum_amounts(t for t in self.transactions if t.is_expense)
     
     @property
     def net_flow(self) -> Decimal:
@@ -0,0 +1,73 @@
+"""
+Kernels numéricos das agregações do analisador.
+
+Os valores chegam em centavos (int64) ou, quando algum valor tem frações de
+centavo ou não cabe em int64, como objetos Decimal (dtype object). As somas
+usam ``np.add.at``, que acumula no dtype de entrada e é exato nos dois casos.
+Com numba instalado, as somas em int64 são laços compilados com ``@njit``, com
+o mesmo resultado.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba é opcional
+    njit = None
+
+
+def _add_by_code(codes, amounts, size):
+    out = np.zeros(size, amounts.dtype)
+    np.add.at(out, codes, amounts)
+    return out
+
+
+def _category_sums_exact(amounts, categories, is_expense, n_categories):
+    return _add_by_code(categories[is_expense], amounts[is_expense], n_categories)
+
+
+def _monthly_sums_exact(amounts, months, is_income, n_months):
+    out = np.zeros((n_months, 2), amounts.dtype)
+    out[:, 0] = _add_by_code(months[is_income], amounts[is_income], n_months)
+    out[:, 1] = _add_by_code(months[~is_income], amounts[~is_income], n_months)
+    return out
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _category_sums_int64(amounts, categories, is_expense, n_categories):
+        out = np.zeros(n_categories, np.int64)
+        for i in range(amounts.size):
+            if is_expense[i]:
+                out[categories[i]] += amounts[i]
+        return out
+
+    @njit(cache=True)
+    def _monthly_sums_int64(amounts, months, is_income, n_months):
+        out = np.zeros((n_months, 2), np.int64)
+        for i in range(amounts.size):
+            if is_income[i]:
+                out[months[i], 0] += amounts[i]
+            else:
+                out[months[i], 1] += amounts[i]
+        return out
+
+else:
+
+    # Sem numba, o mesmo np.add.at das colunas Decimal acumula direto em int64
+    _category_sums_int64 = _category_sums_exact
+    _monthly_sums_int64 = _monthly_sums_exact
+
+
+def category_sums(amounts, categories, is_expense, n_categories):
+    """Soma as despesas de cada código de categoria."""
+    if amounts.dtype == object:
+        return _category_sums_exact(amounts, categories, is_expense, n_categories)
+    return _category_sums_int64(amounts, categories, is_expense, n_categories)
+
+
+def monthly_sums(amounts, months, is_income, n_months):
+    """Soma [receitas, despesas] de cada mês (coluna 0 e 1)."""
+    if amounts.dtype == object:
+        return _monthly_sums_exact(amounts, months, is_income, n_months)
+    return _monthly_sums_int64(amounts, months, is_income, n_months)
@@ -1,36 +1,96 @@
 """
 Implementação do analisador básico de extratos.
 """
-from collections import defaultdict
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List, NamedTuple
 
-from src.domain.models import BankStatement, AnalysisResult, TransactionCategory
+import numpy as np
+
+from src.domain.models import (
+    BankStatement,
+    AnalysisResult,
+    Transaction,
+    TransactionCategory,
+    cents_to_decimal,
+    exact_cents,
+)
 from src.domain.interfaces import StatementAnalyzer
+from src.infrastructure.analyzers._kernels import category_sums, monthly_sums
 from src.utils.currency_utils import CurrencyUtils
 
+# Código inteiro de cada categoria, usado como índice nas somas por grupo
+_CATEGORIES = tuple(TransactionCategory)
+_CATEGORY_CODES = {category: code for code, category in enumerate(_CATEGORIES)}
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+class _TransactionColumns(NamedTuple):
+    """Colunas NumPy das transações de um extrato, montadas numa única passada."""
+    amounts: np.ndarray      # centavos (int64), ou Decimal (object) se in_cents for False
+    categories: np.ndarray   # código da categoria (índice em _CATEGORIES)
+    months: np.ndarray       # ano * 12 + (mês - 1)
+    is_income: np.ndarray    # bool
+    is_expense: np.ndarray   # bool
+    in_cents: bool           # False se algum valor tem frações de centavo ou o total não cabe em int64
+
+    @classmethod
+    def from_transactions(cls, transactions: List[Transaction]) -> "_TransactionColumns":
+        codes = _CATEGORY_CODES
+        table = np.array(
+            [
+                (codes[t.category], t.date.year * 12 + t.date.month - 1, t.is_income, t.is_expense)
+                for t in transactions
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 4)
+        amounts = [t.amount for t in transactions]
+        cents = [exact_cents(a) for a in amounts]
+        # Soma dos módulos abaixo do limite garante que nenhuma soma parcial estoura int64
+        in_cents = None not in cents and sum(map(abs, cents)) <= _INT64_MAX
+        return cls(
+            amounts=np.array(cents, dtype=np.int64) if in_cents else np.array(amounts, dtype=object),
+            categories=table[:, 0],
+            months=table[:, 1],
+            is_income=table[:, 2].astype(bool),
+            is_expense=table[:, 3].astype(bool),
+            in_cents=in_cents,
+        )
+
+    def to_decimal(self, value) -> Decimal:
+        """Converte uma soma de amounts para Decimal."""
+        return cents_to_decimal(int(value)) if self.in_cents else Decimal(value)
+
+
+def _ordered_present(codes: np.ndarray) -> np.ndarray:
+    """Códigos distintos presentes em codes, na ordem da primeira ocorrência."""
+    unique, first_index = np.unique(codes, return_index=True)
+    return unique[np.argsort(first_index, kind='stable')]
+
 
 class BasicStatementAnalyzer(StatementAnalyzer):
     """Analisador básico de extratos bancários."""
     
     def analyze(self, statement: BankStatement) -> AnalysisResult:
         """Analisa um extrato e retorna resultados."""
+        # Colunas NumPy montadas uma vez e reaproveitadas por todos os cálculos
+        columns = _TransactionColumns.from_transactions(statement.transactions)
+        
         # Calcula totais
-        total_income = statement.total_income
-        total_expenses = statement.total_expenses
-        net_flow = statement.net_flow
+        total_income = columns.to_decimal(columns.amounts[columns.is_income].sum())
+        total_expenses = columns.to_decimal(columns.amounts[columns.is_expense].sum())
+        net_flow = total_income - total_expenses
         
         # Resumo por categoria
-        categories_summary = self._calculate_categories_summary(statement)
+        categories_summary = self._calculate_categories_summary(columns)
         
         # Resumo mensal
-        monthly_summary = self._calculate_monthly_summary(statement)
+        monthly_summary = self._calculate_monthly_summary(columns)
         
         # Gera alertas
-        alerts = self._generate_alerts(statement, categories_summary)
+        alerts = self._generate_alerts(statement, categories_summary, columns, total_expenses, net_flow)
         
         # Gera insights
-        insights = self._generate_insights(statement, categories_summary)
+        insights = self._generate_insights(statement, categories_summary, columns, total_expenses)
         
         return AnalysisResult(
             statement_id=statement.id,
@@ -48,55 +108,64 @@ class BasicStatementAnalyzer(StatementAnalyzer):
             }
         )
     
-    def _calculate_categories_summary(self, statement: BankStatement) -> Dict[TransactionCategory, Decimal]:
+    def _calculate_categories_summary(self, columns: _TransactionColumns) -> Dict[TransactionCategory, Decimal]:
         """Calcula resumo de gastos por categoria."""
-        summary = defaultdict(Decimal)
+        # Soma em centavos por código de categoria; a conversão para Decimal fica para o final
+        totals = category_sums(columns.amounts, columns.categories, columns.is_expense, len(_CATEGORIES))
+        present = _ordered_present(columns.categories[columns.is_expense])
         
-        for transaction in statement.transactions:
-            if transaction.is_expense:
-                summary[transaction.category] += transaction.amount
-        
-        # Converte para dict normal e ordena por valor
-        return dict(sorted(summary.items(), key=lambda x: x[1], reverse=True))
+        # Ordena por valor (empates na ordem em que a categoria apareceu)
+        ordered = sorted(present.tolist(), key=lambda code: totals[code], reverse=True)
+        return {_CATEGORIES[code]: columns.to_decimal(totals[code]) for code in ordered}
     
-    def _calculate_monthly_summary(self, statement: BankStatement) -> Dict[str, Dict[str, Decimal]]:
+    def _calculate_monthly_summary(self, columns: _TransactionColumns) -> Dict[str, Dict[str, Decimal]]:
         """Calcula resumo mensal de receitas e despesas."""
-        monthly = defaultdict(lambda: {'income': Decimal('0'), 'expenses': Decimal('0')})
-        
-        for transaction in statement.transactions:
-            month_key = transaction.date.strftime('%Y-%m')
-            
-            if transaction.is_income:
-                monthly[month_key]['income'] += transaction.amount
-            else:
-                monthly[month_key]['expenses'] += transaction.amount
+        if not len(columns.months):
+            return {}
         
-        # Calcula saldo mensal
-        for month_data in monthly.values():
-            month_data['balance'] = month_data['income'] - month_data['expenses']
+        # Meses relativos ao primeiro, para as somas ficarem do tamanho do período
+        base = int(columns.months.min())
+        offsets = columns.months - base
+        size = int(offsets.max()) + 1
+        sums = monthly_sums(columns.amounts, offsets, columns.is_income, size)
         
-        return dict(monthly)
+        # Converte para Decimal e calcula saldo mensal, na ordem em que os meses aparecem
+        monthly = {}
+        for offset in _ordered_present(offsets).tolist():
+            year, month = divmod(base + offset, 12)
+            month_income, month_expenses = columns.to_decimal(sums[offset, 0]), columns.to_decimal(sums[offset, 1])
+            monthly[f"{year:04d}-{month + 1:02d}"] = {
+                'income': month_income,
+                'expenses': month_expenses,
+                'balance': month_income - month_expenses,
+            }
+        return monthly
     
-    def _generate_alerts(self, statement: BankStatement, categories_summary: Dict) -> list[str]:
-        """Gera alertas baseados na análise."""
+    def _generate_alerts(
+        self,
+        statement: BankStatement,
+        categories_summary: Dict,
+        columns: _TransactionColumns,
+        total_expenses: Decimal,
+        net_flow: Decimal,
+    ) -> list[str]:
+        """Gera alertas baseados na análise (totais já calculados em analyze)."""
         alerts = []
         currency_symbol = CurrencyUtils.get_currency_symbol(statement.currency)
         
         # Alerta de saldo negativo
-        if statement.net_flow < 0:
-            deficit = abs(statement.net_flow)
+        if net_flow < 0:
+            deficit = abs(net_flow)
             alerts.append(f"⚠️ Atenção: Despesas superaram receitas em {currency_symbol} {deficit:.2f}")
         
         # Alerta de muitas transações não categorizadas
-        uncategorized = sum(
-            1 for t in statement.transactions 
-            if t.category == TransactionCategory.NAO_CATEGORIZADO
-        )
+        uncategorized = int(np.count_nonzero(
+            columns.categories == _CATEGORY_CODES[TransactionCategory.NAO_CATEGORIZADO]
+        ))
         if uncategorized > len(statement.transactions) * 0.3:
             alerts.append(f"⚠️ {uncategorized} transações não foram categorizadas automaticamente")
         
         # Alerta de gastos altos em categorias específicas
-        total_expenses = statement.total_expenses
         if total_expenses > 0:
             for category, amount in categories_summary.items():
                 percentage = (amount / total_expenses) * 100
@@ -105,21 +174,31 @@ class BasicStatementAnalyzer(StatementAnalyzer):
                         f"⚠️ Gastos com {category.value} representam {percentage:.1f}% do total"
                     )
         
-        # Alerta de transações de alto valor
-        avg_expense = (
-            total_expenses / len([t for t in statement.transactions if t.is_expense])
-            if any(t.is_expense for t in statement.transactions) else Decimal('0')
-        )
+        # Alerta de transações de alto valor (só as despesas são percorridas)
+        max_alerts = 5
+        expense_indexes = np.flatnonzero(columns.is_expense).tolist()
+        avg_expense = total_expenses / len(expense_indexes) if expense_indexes else Decimal('0')
+        threshold = avg_expense * 3
         
-        for transaction in statement.transactions:
-            if transaction.is_expense and transaction.amount > avg_expense * 3:
+        transactions = statement.transactions
+        for i in expense_indexes:
+            if len(alerts) >= max_alerts:
+                break
+            transaction = transactions[i]
+            if transaction.amount > threshold:
                 alerts.append(
                     f"⚠️ Transação de alto valor: {transaction.description[:50]} - {currency_symbol} {transaction.amount:.2f}"
                 )
         
-        return alerts[:5]  # Limita a 5 alertas mais importantes
+        return alerts[:max_alerts]  # Limita a 5 alertas mais importantes
     
-    def _generate_insights(self, statement: BankStatement, categories_summary: Dict) -> list[str]:
+    def _generate_insights(
+        self,
+        statement: BankStatement,
+        categories_summary: Dict,
+        columns: _TransactionColumns,
+        total_expenses: Decimal,
+    ) -> list[str]:
         """Gera insights sobre os gastos."""
         insights = []
         currency_symbol = CurrencyUtils.get_currency_symbol(statement.currency)
@@ -128,7 +207,7 @@ class BasicStatementAnalyzer(StatementAnalyzer):
         if categories_summary:
             top_category = list(categories_summary.keys())[0]
             top_amount = categories_summary[top_category]
-            percentage = (top_amount / statement.total_expenses * 100) if statement.total_expenses > 0 else 0
+            percentage = (top_amount / total_expenses * 100) if total_expenses > 0 else 0
             
             insights.append(
                 f"💡 Maior categoria de gastos: {top_category.value} ({currency_symbol} {top_amount:.2f} - {percentage:.1f}%)"
@@ -138,22 +217,21 @@ class BasicStatementAnalyzer(StatementAnalyzer):
         if statement.period_end is not None and statement.period_start is not None and statement.period_end > statement.period_start:
             days = (statement.period_end - statement.period_start).days
             if days > 0:
-                daily_avg = statement.total_expenses / days
+                daily_avg = total_expenses / days
                 insights.append(f"💡 Média diária de gastos: {currency_symbol} {daily_avg:.2f}")
         
         # Insight sobre padrão de gastos
-        expense_transactions = [t for t in statement.transactions if t.is_expense]
-        if len(expense_transactions) > 10:
-            amounts = [t.amount for t in expense_transactions]
-            amounts.sort()
+        amounts = columns.amounts[columns.is_expense]
+        if len(amounts) > 10:
+            # Seleção em O(N) do elemento central, sem ordenar todas as despesas
             median_idx = len(amounts) // 2
-            median = amounts[median_idx]
+            median = np.partition(amounts, median_idx)[median_idx]
             
-            small_transactions = sum(1 for a in amounts if a < median)
+            small_transactions = int(np.count_nonzero(amounts < median))
             percentage = (small_transactions / len(amounts)) * 100
             
             insights.append(
-                f"💡 {percentage:.0f}% das suas despesas são menores que {currency_symbol} {median:.2f}"
+                f"💡 {percentage:.0f}% das suas despesas são menores que {currency_symbol} {columns.to_decimal(median):.2f}"
             )
         
         # Insight sobre frequência de transações
@@ -2,18 +2,44 @@
 Implementação de categorizador simples de transações baseado em palavras-chave.
 """
 import re
-from typing import Dict, List
+from typing import Dict, List, Pattern, Tuple
 
 from src.domain.models import Transaction, TransactionCategory
 from src.domain.interfaces import TransactionCategorizer
 
+# Tabela de remoção de acentos e padrão de caracteres especiais, montados uma única vez
+_ACCENT_TABLE = str.maketrans('áàãâäéèêëíìîïóòõôöúùûüçñ', 'aaaaaeeeeiiiiooooouuuucn')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+
 
 class KeywordCategorizer(TransactionCategorizer):
     """Categorizador de transações baseado em palavras-chave."""
     
     def __init__(self):
+        # Uma regex (alternação das palavras-chave normalizadas) por categoria,
+        # compilada no primeiro uso e descartada quando as palavras-chave mudam
+        self._keyword_patterns = None
         self.keywords = self._load_keywords()
     
+    @property
+    def keywords(self) -> Dict[TransactionCategory, List[str]]:
+        """Palavras-chave por categoria.
+
+        Para alterar, atribua um novo dicionário ou use add_keyword; edições
+        diretas nas listas não recompilam as regexes.
+        """
+        return self._keywords
+    
+    @keywords.setter
+    def keywords(self, value: Dict[TransactionCategory, List[str]]) -> None:
+        self._keywords = value
+        self._keyword_patterns = None
+    
+    def add_keyword(self, category: TransactionCategory, keyword: str) -> None:
+        """Adiciona uma palavra-chave à categoria e invalida as regexes compiladas."""
+        self._keywords.setdefault(category, []).append(keyword)
+        self._keyword_patterns = None
+    
     def _load_keywords(self) -> Dict[TransactionCategory, List[str]]:
         """Define palavras-chave para cada categoria."""
         return {
@@ -93,18 +119,45 @@ class KeywordCategorizer(TransactionCategorizer):
     
     def categorize(self, transaction: Transaction) -> Transaction:
         """Categoriza uma transação baseado em sua descrição."""
-        description_lower = transaction.description.lower()
-        
+        return self._categorize_with(transaction, self._get_keyword_patterns())
+
+    def categorize_batch(self, transactions: List[Transaction]) -> List[Transaction]:
+        """Categoriza várias transações compilando as palavras-chave uma única vez."""
+        table = self._get_keyword_patterns()
+        categorize_with = self._categorize_with
+        return [categorize_with(transaction, table) for transaction in transactions]
+
+    def _get_keyword_patterns(self) -> List[Tuple[TransactionCategory, Pattern]]:
+        """Retorna uma regex por categoria, na ordem de prioridade das categorias.
+
+        Cada regex é a alternação das palavras-chave normalizadas da categoria, de
+        modo que uma única busca substitui o teste de cada palavra-chave.
+        """
+        if self._keyword_patterns is None:
+            table = []
+            for category, keywords in self.keywords.items():
+                normalized = [self._normalize_text(keyword.lower()) for keyword in keywords]
+                # Sem palavras-chave válidas, a regex vazia casaria com qualquer descrição
+                normalized = [keyword for keyword in normalized if keyword]
+                if normalized:
+                    table.append((category, re.compile('|'.join(map(re.escape, normalized)))))
+            self._keyword_patterns = table
+        return self._keyword_patterns
+
+    def _categorize_with(
+        self,
+        transaction: Transaction,
+        table: List[Tuple[TransactionCategory, Pattern]],
+    ) -> Transaction:
+        """Aplica as regexes por categoria a uma transação."""
         # Remove acentos para melhor matching
-        description_normalized = self._normalize_text(description_lower)
+        description_normalized = self._normalize_text(transaction.description.lower())
         
-        # Tenta encontrar categoria por palavras-chave
-        for category, keywords in self.keywords.items():
-            for keyword in keywords:
-                keyword_normalized = self._normalize_text(keyword.lower())
-                if keyword_normalized in description_normalized:
-                    transaction.category = category
-                    return transaction
+        # A primeira categoria com alguma palavra-chave na descrição vence
+        for category, pattern in table:
+            if pattern.search(description_normalized):
+                transaction.category = category
+                return transaction
         
         # Se não encontrou categoria, mantém como não categorizado
         transaction.category = TransactionCategory.NAO_CATEGORIZADO
@@ -112,23 +165,6 @@ class KeywordCategorizer(TransactionCategorizer):
     
     def _normalize_text(self, text: str) -> str:
         """Normaliza texto removendo acentos e caracteres especiais."""
-        # Remove acentos comuns
-        replacements = {
-            'á': 'a', 'à': 'a', 'ã': 'a', 'â': 'a', 'ä': 'a',
-            'é': 'e', 'è': 'e', 'ê': 'e', 'ë': 'e',
-            'í': 'i', 'ì': 'i', 'î': 'i', 'ï': 'i',
-            'ó': 'o', 'ò': 'o', 'õ': 'o', 'ô': 'o', 'ö': 'o',
-            'ú': 'u', 'ù': 'u', 'û': 'u', 'ü': 'u',
-            'ç': 'c', 'ñ': 'n'
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        # Remove caracteres especiais mantendo espaços e números
-        text = re.sub(r'[^a-z0-9\s]', ' ', text)
-        
-        # Remove espaços múltiplos
-        text = ' '.join(text.split())
-        
-        return text
\ No newline at end of file
+        # Remove acentos comuns e caracteres especiais (mantendo espaços e números),
+        # depois colapsa espaços múltiplos
+        return ' '.join(_NON_ALNUM_RE.sub(' ', text.translate(_ACCENT_TABLE)).split())
@@ -7,7 +7,7 @@ import logging
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import pandas as pd
 
 from src.domain.models import BankStatement, Transaction, TransactionType
@@ -17,9 +17,37 @@ from src.utils.currency_utils import CurrencyUtils
 
 logger = logging.getLogger(__name__)
 
+# Caracteres removidos dos valores monetários (tudo exceto dígitos, ponto, vírgula e sinal)
+_NON_AMOUNT_RE = re.compile(r'[^\d.,+-]')
+
 
 class BaseStatementReader(StatementReader):
     """Classe base para leitores de extratos bancários."""
+
+    # Extensões (minúsculas, com ponto) aceitas pelo leitor
+    SUPPORTED_EXTENSIONS: Tuple[str, ...] = ()
+
+    # Padrões dos dados de cabeçalho, em ordem de prioridade, compilados uma única vez
+    _BANK_PATTERNS = (
+        re.compile(r'banco\s+(\w+)'),
+        re.compile(r'(\w+)\s+banco'),
+        re.compile(r'(\w+)\s+bank'),
+    )
+    _ACCOUNT_PATTERNS = (
+        re.compile(r'conta[:\s]*(\d+[-.]?\d*)'),
+        re.compile(r'account[:\s]*(\d+[-.]?\d*)'),
+        re.compile(r'(\d{4,}[-.]?\d*)'),  # Números com 4+ dígitos
+    )
+    _INITIAL_BALANCE_PATTERNS = (
+        re.compile(r'saldo\s+inicial[:\s]*([\d.,+-]+)'),
+        re.compile(r'initial\s+balance[:\s]*([\d.,+-]+)'),
+        re.compile(r'saldo\s+anterior[:\s]*([\d.,+-]+)'),
+    )
+    _FINAL_BALANCE_PATTERNS = (
+        re.compile(r'saldo\s+final[:\s]*([\d.,+-]+)'),
+        re.compile(r'final\s+balance[:\s]*([\d.,+-]+)'),
+        re.compile(r'saldo\s+atual[:\s]*([\d.,+-]+)'),
+    )
     
     def __init__(self):
         self.currency = "EUR"  # Será detectado automaticamente
@@ -37,7 +65,7 @@ class BaseStatementReader(StatementReader):
             return Decimal("0.00")
         
         # Remove caracteres não numéricos exceto ponto, vírgula e sinal
-        cleaned = re.sub(r'[^\d.,+-]', '', original_value)
+        cleaned = _NON_AMOUNT_RE.sub('', original_value)
         
         if not cleaned:
             logger.warning(f"Não foi possível extrair números do valor: '{original_value}'")
@@ -59,6 +87,41 @@ class BaseStatementReader(StatementReader):
             logger.warning(f"Erro ao converter valor '{original_value}' para Decimal: {e}")
             return Decimal("0.00")
     
+    def _parse_amount_column(self, values: pd.Series) -> List[Decimal]:
+        """Converte uma coluna inteira de valores para Decimal.
+
+        Mesmas regras de _parse_amount, mas a limpeza e a troca de separadores são
+        feitas com operações vetorizadas do pandas, e a conversão para Decimal só
+        roda uma vez por valor distinto.
+        """
+        cleaned = values.astype(str).str.strip().str.replace(_NON_AMOUNT_RE, '', regex=True)
+        
+        # Formato 1.234,56: remove o ponto de milhar antes de trocar a vírgula
+        has_both = cleaned.str.contains(',', regex=False) & cleaned.str.contains('.', regex=False)
+        cleaned = cleaned.where(~has_both, cleaned.str.replace('.', '', regex=False))
+        cleaned = cleaned.str.replace(',', '.', regex=False)
+        
+        parsed = {}
+        for value in cleaned.unique():
+            try:
+                parsed[value] = Decimal(value) if value else Decimal("0.00")
+            except (ValueError, TypeError, decimal.InvalidOperation) as e:
+                logger.warning(f"Erro ao converter valor '{value}' para Decimal: {e}")
+                parsed[value] = Decimal("0.00")
+        return [parsed[value] for value in cleaned.tolist()]
+    
+    def _parse_date_column(self, values: pd.Series) -> List[datetime]:
+        """Converte uma coluna inteira de datas, chamando _parse_date uma vez por valor distinto.
+
+        Extratos repetem a mesma data em várias linhas, então o custo de tentar os
+        formatos (e o fallback do pandas) deixa de ser pago por linha. Devolve uma
+        lista (e não uma Series) para manter objetos datetime, sem conversão para
+        Timestamp.
+        """
+        stripped = values.astype(str).str.strip().tolist()
+        parsed = {value: self._parse_date(value) for value in set(stripped)}
+        return [parsed[value] for value in stripped]
+    
     def _parse_date(self, date_str: str) -> datetime:
         """Converte string para datetime, tratando diferentes formatos."""
         if pd.isna(date_str) or date_str == '':
@@ -116,77 +179,48 @@ class BaseStatementReader(StatementReader):
         # Padrão: valor zero é débito
         return TransactionType.DEBIT
     
-    def _extract_bank_name(self, df: pd.DataFrame) -> str:
-        """Extrai o nome do banco do DataFrame."""
-        # Procura por padrões comuns de nome de banco
-        bank_patterns = [
-            r'banco\s+(\w+)',
-            r'(\w+)\s+banco',
-            r'(\w+)\s+bank',
-        ]
+    def _first_match(self, df: pd.DataFrame, patterns: Tuple[re.Pattern, ...]) -> Optional[str]:
+        """Retorna o grupo 1 da primeira célula (coluna a coluna) que casa algum padrão.
+
+        As células são empilhadas numa única Series em minúsculas e cada padrão roda
+        vetorizado com Series.str.extract. Numa mesma célula vale o primeiro padrão
+        da lista, como na busca linha a linha.
+        """
+        columns = [df.iloc[:, i].dropna().astype(str) for i in range(df.shape[1])]
+        if not columns:
+            return None
+        cells = pd.concat(columns, ignore_index=True).str.lower()
         
-        for col in df.columns:
-            for value in df[col].dropna().astype(str):
-                for pattern in bank_patterns:
-                    match = re.search(pattern, value.lower())
-                    if match:
-                        return match.group(1).title()
+        matches = cells.str.extract(patterns[0], expand=False)
+        for pattern in patterns[1:]:
+            # Os padrões seguintes só rodam nas células que ainda não casaram
+            missing = matches.isna()
+            if not missing.any():
+                break
+            matches[missing] = cells[missing].str.extract(pattern, expand=False)
         
-        return "Banco Desconhecido"
+        first = matches.first_valid_index()
+        return None if first is None else matches[first]
+    
+    def _extract_bank_name(self, df: pd.DataFrame) -> str:
+        """Extrai o nome do banco do DataFrame."""
+        match = self._first_match(df, self._BANK_PATTERNS)
+        return match.title() if match is not None else "Banco Desconhecido"
     
     def _extract_account_number(self, df: pd.DataFrame) -> str:
         """Extrai o número da conta do DataFrame."""
-        # Procura por padrões de número de conta
-        account_patterns = [
-            r'conta[:\s]*(\d+[-.]?\d*)',
-            r'account[:\s]*(\d+[-.]?\d*)',
-            r'(\d{4,}[-.]?\d*)',  # Números com 4+ dígitos
-        ]
-        
-        for col in df.columns:
-            for value in df[col].dropna().astype(str):
-                for pattern in account_patterns:
-                    match = re.search(pattern, value.lower())
-                    if match:
-                        return match.group(1)
-        
-        return "N/A"
+        match = self._first_match(df, self._ACCOUNT_PATTERNS)
+        return match if match is not None else "N/A"
     
     def _extract_initial_balance(self, df: pd.DataFrame) -> Decimal:
         """Extrai o saldo inicial do DataFrame."""
-        # Procura por padrões de saldo inicial
-        balance_patterns = [
-            r'saldo\s+inicial[:\s]*([\d.,+-]+)',
-            r'initial\s+balance[:\s]*([\d.,+-]+)',
-            r'saldo\s+anterior[:\s]*([\d.,+-]+)',
-        ]
-        
-        for col in df.columns:
-            for value in df[col].dropna().astype(str):
-                for pattern in balance_patterns:
-                    match = re.search(pattern, value.lower())
-                    if match:
-                        return self._parse_amount(match.group(1))
-        
-        return Decimal("0.00")
+        match = self._first_match(df, self._INITIAL_BALANCE_PATTERNS)
+        return self._parse_amount(match) if match is not None else Decimal("0.00")
     
     def _extract_final_balance(self, df: pd.DataFrame) -> Decimal:
         """Extrai o saldo final do DataFrame."""
-        # Procura por padrões de saldo final
-        balance_patterns = [
-            r'saldo\s+final[:\s]*([\d.,+-]+)',
-            r'final\s+balance[:\s]*([\d.,+-]+)',
-            r'saldo\s+atual[:\s]*([\d.,+-]+)',
-        ]
-        
-        for col in df.columns:
-            for value in df[col].dropna().astype(str):
-                for pattern in balance_patterns:
-                    match = re.search(pattern, value.lower())
-                    if match:
-                        return self._parse_amount(match.group(1))
-        
-        return Decimal("0.00")
+        match = self._first_match(df, self._FINAL_BALANCE_PATTERNS)
+        return self._parse_amount(match) if match is not None else Decimal("0.00")
     
     def _extract_start_date(self, transactions: List[Transaction]) -> datetime:
         """Extrai a data de início baseada nas transações."""
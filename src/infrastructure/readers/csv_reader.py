@@ -13,12 +13,14 @@ from src.infrastructure.readers.base_reader import BaseStatementReader
 
 class CSVStatementReader(BaseStatementReader):
     """Leitor de extratos bancários em formato CSV."""
+
+    SUPPORTED_EXTENSIONS = ('.csv',)
         
     def can_read(self, file_path: Path) -> bool:
         """Verifica se pode ler o arquivo CSV."""
         if isinstance(file_path, str):
             file_path = Path(file_path)
-        return file_path.suffix.lower() == '.csv'
+        return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
     
     def read(self, file_path: Path) -> BankStatement:
         """Lê o arquivo CSV e retorna um extrato."""
@@ -66,43 +68,24 @@ class CSVStatementReader(BaseStatementReader):
         if not date_col or not description_col or not amount_col:
             raise ParsingError("Não foi possível identificar as colunas necessárias no CSV")
 
-        for _, row in df.iterrows():
-            try:
-                # Extrai e converte a data
-                date_str = str(row[date_col]).strip()
-                date = self._parse_date(date_str)
-
-                # Extrai a descrição
-                description = str(row[description_col]).strip()
-
-                # Extrai e converte o valor
-                amount_str = str(row[amount_col]).strip()
-                amount = self._parse_amount(amount_str)
-                transaction_type = self._determine_transaction_type(amount, description)
-                
-                # Armazena o valor absoluto na transação
-                amount = abs(amount)
-
-                # Extrai o saldo após a transação, se disponível
-                balance_after = None
-                if balance_col and balance_col in df.columns:
-                    balance_str = str(row[balance_col]).strip()
-                    balance_after = self._parse_amount(balance_str)
-
-                # Cria a transação
-                transaction = Transaction(
-                    date=date,
-                    description=description,
-                    amount=amount,
-                    type=transaction_type,
-                    balance_after=balance_after
-                )
-
-                transactions.append(transaction)
-
-            except Exception as e:
-                # Ignora transações que não podem ser processadas
-                continue
+        # Converte as colunas inteiras de uma vez; o laço só monta as transações
+        dates = self._parse_date_column(df[date_col])
+        descriptions = df[description_col].astype(str).str.strip().tolist()
+        amounts = self._parse_amount_column(df[amount_col])
+        if balance_col and balance_col in df.columns:
+            balances = self._parse_amount_column(df[balance_col])
+        else:
+            balances = [None] * len(df)
+
+        determine_type = self._determine_transaction_type
+        for date, description, amount, balance_after in zip(dates, descriptions, amounts, balances):
+            transactions.append(Transaction(
+                date=date,
+                description=description,
+                amount=abs(amount),  # Armazena o valor absoluto na transação
+                type=determine_type(amount, description),
+                balance_after=balance_after
+            ))
 
         return transactions
 
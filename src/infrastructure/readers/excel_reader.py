@@ -8,8 +8,10 @@ import logging
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Optional
+from itertools import islice
+from typing import Iterator, List, Optional
 import pandas as pd
+from openpyxl import load_workbook
 
 from src.domain.models import BankStatement, Transaction, TransactionType
 from src.domain.interfaces import StatementReader
@@ -24,6 +26,10 @@ logger = logging.getLogger(__name__)
 class ExcelStatementReader(BaseStatementReader):
     """Leitor de extratos bancários em formato Excel."""
 
+    # Linhas inspecionadas à procura do cabeçalho real da planilha
+    HEADER_SCAN_ROWS = 100
+    SUPPORTED_EXTENSIONS = ('.xlsx', '.xls')
+
     def __init__(self):
         super().__init__()
         # Debug e mapeamentos externos
@@ -36,6 +42,10 @@ class ExcelStatementReader(BaseStatementReader):
             "chosen_strategy": None,
             "header_detect_row": None,
         }
+        # Conjuntos de nomes de cabeçalho normalizados, montados no primeiro uso
+        self._header_candidates = None
+        # Conta identificada no preâmbulo pela última chamada de read_iter
+        self.account_number = ""
 
     def _debug(self, msg: str, *args):
         if self._debug_enabled:
@@ -63,11 +73,12 @@ class ExcelStatementReader(BaseStatementReader):
 
     def can_read(self, file_path: Path) -> bool:
         """Verifica se pode ler o arquivo Excel."""
-        return file_path.suffix.lower() in [".xlsx", ".xls"]
+        return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
 
     def read(self, file_path: Path) -> BankStatement:
         try:
-            # Lê o arquivo Excel
+            # Abre o arquivo Excel uma única vez; as tentativas abaixo reutilizam o
+            # workbook já carregado em vez de reabrir e reprocessar o arquivo a cada leitura
             excel_file = pd.ExcelFile(file_path)
 
             df = None
@@ -75,7 +86,7 @@ class ExcelStatementReader(BaseStatementReader):
             if "bpi" in file_path.name.lower():
                 # Estratégia 1: header=None e normalização
                 try:
-                    raw = pd.read_excel(file_path, sheet_name="Movimentos", header=None)
+                    raw = pd.read_excel(excel_file, sheet_name="Movimentos", header=None)
                     df = self._normalize_dataframe(raw)
                     self._metrics["attempts"].append({"strategy": "movimentos_header_none_normalize", "ok": True})
                     self._metrics["chosen_strategy"] = "movimentos_header_none_normalize"
@@ -91,7 +102,7 @@ class ExcelStatementReader(BaseStatementReader):
                         dict(sheet_name=excel_file.sheet_names[0]),
                     ):
                         try:
-                            tmp = pd.read_excel(file_path, **attempt)
+                            tmp = pd.read_excel(excel_file, **attempt)
                             tmp = self._normalize_dataframe(tmp)
                             df = tmp
                             self._metrics["attempts"].append({"strategy": f"fallback_{attempt}", "ok": True})
@@ -103,7 +114,7 @@ class ExcelStatementReader(BaseStatementReader):
                             continue
                     if df is None:
                         try:
-                            raw = pd.read_excel(file_path, sheet_name=excel_file.sheet_names[0], header=None)
+                            raw = pd.read_excel(excel_file, sheet_name=excel_file.sheet_names[0], header=None)
                             df = self._normalize_dataframe(raw)
                             self._metrics["attempts"].append({"strategy": "first_sheet_header_none_normalize", "ok": True})
                             self._metrics["chosen_strategy"] = "first_sheet_header_none_normalize"
@@ -113,13 +124,13 @@ class ExcelStatementReader(BaseStatementReader):
             else:
                 # Assume que os dados estão na primeira aba
                 try:
-                    raw = pd.read_excel(file_path, sheet_name=excel_file.sheet_names[0], header=None)
+                    raw = pd.read_excel(excel_file, sheet_name=excel_file.sheet_names[0], header=None)
                     df = self._normalize_dataframe(raw)
                     self._metrics["attempts"].append({"strategy": "first_sheet_header_none_normalize", "ok": True})
                     self._metrics["chosen_strategy"] = "first_sheet_header_none_normalize"
                 except Exception as e:
                     self._metrics["attempts"].append({"strategy": "first_sheet_header_none_normalize", "ok": False, "error": str(e)})
-                    df = pd.read_excel(file_path, sheet_name=excel_file.sheet_names[0])
+                    df = pd.read_excel(excel_file, sheet_name=excel_file.sheet_names[0])
 
             if df is None:
                 raise ParsingError("Falha ao carregar planilha Excel")
@@ -153,6 +164,79 @@ class ExcelStatementReader(BaseStatementReader):
         except Exception as e:
             raise ParsingError(f"Erro ao ler o arquivo Excel: {str(e)}")
 
+    def read_iter(self, file_path: Path) -> Iterator[Transaction]:
+        """Gera as transações da planilha em ordem, lendo uma linha por vez.
+
+        Usa o modo read-only do openpyxl, de modo que a memória não cresce com o
+        número de linhas. O banco e a conta, lidos do preâmbulo, ficam em
+        bank_name e account_number; saldos e moeda não são calculados (para o
+        extrato completo use read()). O openpyxl não abre o formato legado .xls;
+        nesse caso a planilha é lida inteira por read() e as transações são repassadas.
+        """
+        if file_path.suffix.lower() == ".xls":
+            statement = self.read(file_path)
+            self.account_number = statement.account_number
+            yield from statement.transactions
+            return
+
+        try:
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+        except Exception as e:
+            raise ParsingError(f"Erro ao ler o arquivo Excel: {str(e)}")
+
+        try:
+            sheet_name = "Movimentos" if "Movimentos" in workbook.sheetnames else workbook.sheetnames[0]
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+
+            # Procura o cabeçalho real nas primeiras linhas; o preâmbulo serve para identificar o banco
+            preamble = []
+            header = None
+            for row in islice(rows, self.HEADER_SCAN_ROWS):
+                if self._is_header_row(row):
+                    header = list(row)
+                    break
+                preamble.append(row)
+            if header is None:
+                raise ParsingError("Não foi possível localizar o cabeçalho das transações no Excel")
+            self._metrics["header_detect_row"] = len(preamble)
+
+            width = max(len(r) for r in preamble + [header])
+            probe = pd.DataFrame([
+                ["" if v is None else str(v) for v in r] + [""] * (width - len(r))
+                for r in preamble + [header]
+            ])
+            self.bank_name = self._identify_bank(probe)
+            self.account_number = self._extract_account_number(probe)
+            column_map = self._get_column_mappings(self.bank_name)
+
+            columns = pd.DataFrame(columns=header)
+            date_col = self._find_column(columns, column_map["date"])
+            description_col = self._find_column(columns, column_map["description"])
+            amount_col = self._find_column(columns, column_map["amount"]) if "amount" in column_map else None
+            credit_col = self._find_column(columns, column_map.get("credit", []))
+            debit_col = self._find_column(columns, column_map.get("debit", []))
+
+            if not date_col or not description_col or (not amount_col and not (credit_col or debit_col)):
+                raise ParsingError(
+                    f"Não foi possível identificar as colunas necessárias no Excel para o banco {self.bank_name}"
+                )
+
+            # Posição de cada coluna usada; as demais células da linha são ignoradas
+            positions = {
+                col: header.index(col)
+                for col in (date_col, description_col, amount_col, credit_col, debit_col)
+                if col
+            }
+            for row in rows:
+                record = {col: (row[i] if i < len(row) else None) for col, i in positions.items()}
+                transaction = self._row_to_transaction(
+                    record, date_col, description_col, amount_col, credit_col, debit_col
+                )
+                if transaction is not None:
+                    yield transaction
+        finally:
+            workbook.close()
+
     # ----------------------------------------------------
     # Utilidades e mapeamentos
     # ----------------------------------------------------
@@ -276,23 +360,10 @@ class ExcelStatementReader(BaseStatementReader):
         except Exception:
             pass
 
-        date_candidates = {self._normalize_text(x) for x in [
-            "data mov.", "data mov", "data movimento", "data", "date", "data transacao", "transaction date", "data lancamento", "data valor", "data lançamento"
-        ]}
-        desc_candidates = {self._normalize_text(x) for x in [
-            "descricao", "descrição", "description", "detalhes", "descricao movimento", "descrição movimento", "movimento", "descritivo", "descr."
-        ]}
-        amt_candidates = {self._normalize_text(x) for x in [
-            "valor", "amount", "value", "montante", "credito", "crédito", "debit", "debito", "débito", "saldo"
-        ]}
-        max_scan = min(len(df), 100)
+        max_scan = min(len(df), self.HEADER_SCAN_ROWS)
         try:
             for i in range(max_scan):
-                row_vals = [self._normalize_text(v) for v in df.iloc[i].tolist()]
-                has_date = any(v in date_candidates or v.startswith("data") for v in row_vals)
-                has_desc = any(v in desc_candidates or v.startswith("descr") or v.startswith("mov") for v in row_vals)
-                has_amountish = any(v in amt_candidates for v in row_vals)
-                if (has_date and has_desc) or (has_date and has_amountish) or (has_desc and has_amountish):
+                if self._is_header_row(df.iloc[i].tolist()):
                     header_vals = df.iloc[i].tolist()
                     df2 = df.iloc[i + 1 :].copy()
                     df2.columns = header_vals
@@ -303,6 +374,27 @@ class ExcelStatementReader(BaseStatementReader):
             return df
         return df
 
+    def _is_header_row(self, values) -> bool:
+        """Indica se a linha contém ao menos duas dentre: data, descrição e (valor|crédito|débito)."""
+        if self._header_candidates is None:
+            self._header_candidates = (
+                {self._normalize_text(x) for x in [
+                    "data mov.", "data mov", "data movimento", "data", "date", "data transacao", "transaction date", "data lancamento", "data valor", "data lançamento"
+                ]},
+                {self._normalize_text(x) for x in [
+                    "descricao", "descrição", "description", "detalhes", "descricao movimento", "descrição movimento", "movimento", "descritivo", "descr."
+                ]},
+                {self._normalize_text(x) for x in [
+                    "valor", "amount", "value", "montante", "credito", "crédito", "debit", "debito", "débito", "saldo"
+                ]},
+            )
+        date_candidates, desc_candidates, amt_candidates = self._header_candidates
+        row_vals = [self._normalize_text(v) for v in values]
+        has_date = any(v in date_candidates or v.startswith("data") for v in row_vals)
+        has_desc = any(v in desc_candidates or v.startswith("descr") or v.startswith("mov") for v in row_vals)
+        has_amountish = any(v in amt_candidates for v in row_vals)
+        return (has_date and has_desc) or (has_date and has_amountish) or (has_desc and has_amountish)
+
     # ----------------------------------------------------
     # Extrações
     # ----------------------------------------------------
@@ -326,45 +418,50 @@ class ExcelStatementReader(BaseStatementReader):
                     date_col, description_col, amount_col, credit_col, debit_col)
 
         for _, row in df.iterrows():
-            try:
-                amount_raw = None
-                if amount_col:
-                    amount_raw = str(row[amount_col]).strip()
-                else:
-                    credit_raw = str(row[credit_col]).strip() if credit_col else ""
-                    debit_raw = str(row[debit_col]).strip() if debit_col else ""
-                    if credit_raw and credit_raw.lower() not in ["nan", "none", "null", ""]:
-                        amount_raw = credit_raw
-                    elif debit_raw and debit_raw.lower() not in ["nan", "none", "null", ""]:
-                        amount_raw = f"-{debit_raw}" if not str(debit_raw).startswith("-") else debit_raw
-                    else:
-                        amount_raw = ""
-
-                # Ignora linhas vazias/metadados
-                if amount_raw == "" or amount_raw.lower() in ["nan", "none", "null"]:
-                    continue
-
-                amount = self._parse_amount(amount_raw)
-                ttype = self._determine_transaction_type(amount, str(row[description_col]).strip())
-                date_val = self._parse_date(str(row[date_col]).strip())
-                description = str(row[description_col]).strip()
-
-                # Armazena o valor absoluto na transação
-                amount = abs(amount)
-
-                transaction = Transaction(
-                    date=date_val,
-                    description=description,
-                    amount=amount,
-                    type=ttype,
-                )
+            transaction = self._row_to_transaction(row, date_col, description_col, amount_col, credit_col, debit_col)
+            if transaction is not None:
                 transactions.append(transaction)
-            except Exception:
-                # Ignora linhas inválidas
-                continue
 
         return transactions
 
+    def _row_to_transaction(self, row, date_col, description_col, amount_col, credit_col, debit_col) -> Optional[Transaction]:
+        """Converte uma linha (acessível por nome de coluna) em Transaction; None para linhas vazias ou inválidas."""
+        try:
+            amount_raw = None
+            if amount_col:
+                amount_raw = str(row[amount_col]).strip()
+            else:
+                credit_raw = str(row[credit_col]).strip() if credit_col else ""
+                debit_raw = str(row[debit_col]).strip() if debit_col else ""
+                if credit_raw and credit_raw.lower() not in ["nan", "none", "null", ""]:
+                    amount_raw = credit_raw
+                elif debit_raw and debit_raw.lower() not in ["nan", "none", "null", ""]:
+                    amount_raw = f"-{debit_raw}" if not str(debit_raw).startswith("-") else debit_raw
+                else:
+                    amount_raw = ""
+
+            # Ignora linhas vazias/metadados
+            if amount_raw == "" or amount_raw.lower() in ["nan", "none", "null"]:
+                return None
+
+            amount = self._parse_amount(amount_raw)
+            ttype = self._determine_transaction_type(amount, str(row[description_col]).strip())
+            date_val = self._parse_date(str(row[date_col]).strip())
+            description = str(row[description_col]).strip()
+
+            # Armazena o valor absoluto na transação
+            amount = abs(amount)
+
+            return Transaction(
+                date=date_val,
+                description=description,
+                amount=amount,
+                type=ttype,
+            )
+        except Exception:
+            # Ignora linhas inválidas
+            return None
+
     # Métodos auxiliares para extrair outras informações do DataFrame
     def _extract_bank_name(self, df) -> str:
         # Para o BPI, extrai o nome do banco da aba 'Movimentos'
@@ -17,6 +17,8 @@ from src.infrastructure.readers.base_reader import BaseStatementReader
 
 
 class PDFStatementReader(BaseStatementReader):
+    SUPPORTED_EXTENSIONS = ('.pdf',)
+
     # Load configuration from a JSON file
     CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'pdf_reader_config.json')
 
@@ -45,7 +47,7 @@ class PDFStatementReader(BaseStatementReader):
         self.debit_pattern = self.config.get('debit_pattern', r'-?\d+(?:[.,]\d+)?')
 
     def can_read(self, file_path: Path) -> bool:
-        return file_path.suffix.lower() == '.pdf'
+        return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
 
     def read(self, file_path: Path) -> BankStatement:
         try:
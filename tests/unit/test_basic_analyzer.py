@@ -133,3 +133,63 @@ def test_basic_analyzer_insights_conditions():
     assert any("são menores que" in i for i in result.insights)
     assert any("transações por dia" in i for i in result.insights)
     assert any("Potencial de economia" in i for i in result.insights)
+
+
+def test_basic_analyzer_sums_sub_cent_amounts_exactly():
+    analyzer = BasicStatementAnalyzer()
+    date = datetime(2024, 3, 1)
+    statement = BankStatement(
+        period_start=date,
+        period_end=date + timedelta(days=1),
+        transactions=[
+            make_tx(date, "Taxa A", "0.005", TransactionType.DEBIT, TransactionCategory.SERVICOS),
+            make_tx(date, "Taxa B", "0.005", TransactionType.DEBIT, TransactionCategory.SERVICOS),
+            make_tx(date, "Salário", "1.00", TransactionType.CREDIT, TransactionCategory.SALARIO),
+        ],
+    )
+
+    result = analyzer.analyze(statement)
+
+    assert result.total_expenses == Decimal("0.01")
+    assert result.net_flow == Decimal("0.99")
+    assert result.categories_summary[TransactionCategory.SERVICOS] == Decimal("0.01")
+    assert result.monthly_summary["2024-03"]["expenses"] == Decimal("0.01")
+
+
+def test_basic_analyzer_handles_float_derived_amounts():
+    analyzer = BasicStatementAnalyzer()
+    date = datetime(2024, 1, 5)
+    statement = BankStatement(
+        period_start=date,
+        period_end=datetime(2024, 3, 31),
+        transactions=[
+            Transaction(date=date, description="Taxa", amount=0.1 + 0.2, type=TransactionType.DEBIT),
+            make_tx(date, "Compra", "123456.78", TransactionType.DEBIT, TransactionCategory.COMPRAS),
+            make_tx(datetime(2024, 3, 1), "Salário", "1.00", TransactionType.CREDIT, TransactionCategory.SALARIO),
+        ],
+    )
+
+    result = analyzer.analyze(statement)
+
+    assert result.total_expenses == Decimal("0.30000000000000004") + Decimal("123456.78")
+    assert result.total_expenses == statement.total_expenses
+    assert str(result.monthly_summary["2024-01"]["income"]) == "0"
+    assert str(result.monthly_summary["2024-03"]["expenses"]) == "0"
+
+
+def test_basic_analyzer_group_sums_match_totals_above_float_precision():
+    analyzer = BasicStatementAnalyzer()
+    date = datetime(2024, 1, 5)
+    # 9007199254740993 centavos não é representável em float64
+    amount = "90071992547409.93"
+    statement = BankStatement(
+        period_start=date,
+        period_end=date + timedelta(days=1),
+        transactions=[make_tx(date, "Compra", amount, TransactionType.DEBIT, TransactionCategory.COMPRAS)],
+    )
+
+    result = analyzer.analyze(statement)
+
+    assert result.total_expenses == Decimal(amount)
+    assert result.categories_summary[TransactionCategory.COMPRAS] == Decimal(amount)
+    assert result.monthly_summary["2024-01"]["expenses"] == Decimal(amount)
@@ -111,6 +111,13 @@ class TestCSVStatementReader:
         amount = reader._parse_amount("valor invalido")
         assert amount == Decimal("0.00")
     
+    def test_parse_amount_column_matches_parse_amount(self):
+        """Testa que a conversão por coluna segue as mesmas regras de _parse_amount."""
+        reader = CSVStatementReader()
+        values = ["R$ 1.234,56", "-150,50", "2500.00", "valor invalido", "", "1.2.3"]
+        
+        assert reader._parse_amount_column(pd.Series(values)) == [reader._parse_amount(v) for v in values]
+    
     
     @patch("pandas.read_csv")
     @patch("src.utils.currency_utils.CurrencyUtils.extract_currency_from_dataframe")
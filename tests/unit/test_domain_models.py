@@ -18,6 +18,7 @@ class TestTransaction:
         assert transaction.description == "Test transaction"
         assert transaction.amount == Decimal("100.50")
         assert transaction.type == TransactionType.CREDIT
+        assert transaction.amount_cents == 10050
         assert transaction.category == TransactionCategory.NAO_CATEGORIZADO
     
     def test_transaction_post_init_conversion(self):
@@ -35,6 +36,14 @@ class TestTransaction:
         assert transaction.amount == Decimal("100.50")
         assert transaction.balance_after == Decimal("200.75")
     
+    def test_transaction_amount_cents_follows_amount(self):
+        """Testa que amount_cents acompanha alterações em amount."""
+        transaction = Transaction(amount=Decimal("10.00"))
+        
+        transaction.amount = Decimal("12.34")
+        
+        assert transaction.amount_cents == 1234
+    
     def test_transaction_is_income(self):
         """Testa a propriedade is_income."""
         credit_transaction = Transaction(
@@ -213,6 +222,29 @@ class TestBankStatement:
         
         assert statement.net_flow == Decimal("2350.00")  # 2500 - 150
     
+    def test_bank_statement_totals_keep_sub_cent_amounts(self):
+        """Testa que valores com frações de centavo somam sem arredondamento."""
+        statement = BankStatement(
+            transactions=[
+                Transaction(amount=Decimal("0.005"), type=TransactionType.DEBIT),
+                Transaction(amount=Decimal("0.005"), type=TransactionType.DEBIT),
+                Transaction(amount=Decimal("1.00"), type=TransactionType.CREDIT),
+            ]
+        )
+        
+        assert statement.total_expenses == Decimal("0.01")
+        assert statement.total_income == Decimal("1.00")
+        assert statement.net_flow == Decimal("0.99")
+    
+    def test_bank_statement_totals_follow_mutated_amounts(self):
+        """Testa que os totais refletem alterações em amount após a criação."""
+        transaction = Transaction(amount=Decimal("10.00"), type=TransactionType.DEBIT)
+        statement = BankStatement(transactions=[transaction])
+        
+        transaction.amount = Decimal("25.50")
+        
+        assert statement.total_expenses == Decimal("25.50")
+    
     def test_bank_statement_transaction_count(self):
         """Testa a contagem de transações."""
         transactions = [
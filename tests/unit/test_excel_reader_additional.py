@@ -122,3 +122,58 @@ def test_extract_initial_and_final_balance():
     final = r._extract_final_balance(df)
     assert init == Decimal("1234.56")
     assert final == Decimal("2000.00")
+
+
+def test_read_iter_streams_transactions_after_preamble(tmp_path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Movimentos"
+    ws.append(["Extrato BPI"])
+    ws.append(["Conta", "1-1234567.000.001"])
+    ws.append(["Data Mov.", "Descrição", "Valor"])
+    ws.append(["01/01/2025", "Salário", "1.000,00"])
+    ws.append([None, None, None])
+    ws.append(["02/01/2025", "Mercado", "-25,50"])
+    path = tmp_path / "extrato_bpi.xlsx"
+    wb.save(path)
+
+    r = ExcelStatementReader()
+    txs = list(r.read_iter(path))
+
+    assert r.bank_name == "BPI"
+    assert r.account_number == "1-1234567.000.001"
+    assert r._metrics["header_detect_row"] == 2
+    assert [t.description for t in txs] == ["Salário", "Mercado"]
+    assert txs[0].amount == Decimal("1000.00") and txs[0].type == TransactionType.CREDIT
+    assert txs[1].amount == Decimal("25.50") and txs[1].type == TransactionType.DEBIT
+    assert txs[1].date == datetime(2025, 1, 2)
+
+
+def test_read_iter_without_header_raises(tmp_path):
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    wb.active.append(["sem", "cabeçalho"])
+    path = tmp_path / "planilha.xlsx"
+    wb.save(path)
+
+    with pytest.raises(ParsingError):
+        list(ExcelStatementReader().read_iter(path))
+
+
+def test_read_iter_falls_back_to_read_for_xls(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    transactions = [object(), object()]
+    reader = ExcelStatementReader()
+    monkeypatch.setattr(reader, "read", lambda path: SimpleNamespace(transactions=transactions, account_number="1-234"))
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("openpyxl não deve ser usado para .xls")
+
+    monkeypatch.setattr("src.infrastructure.readers.excel_reader.load_workbook", fail_load)
+
+    assert list(reader.read_iter(tmp_path / "legado.xls")) == transactions
+    assert reader.account_number == "1-234"
@@ -208,4 +208,45 @@ class TestKeywordCategorizer:
         assert TransactionCategory.SERVICOS in categorizer.keywords
         assert TransactionCategory.TRANSFERENCIA in categorizer.keywords
         assert TransactionCategory.INVESTIMENTO in categorizer.keywords
-        assert TransactionCategory.SALARIO in categorizer.keywords
\ No newline at end of file
+        assert TransactionCategory.SALARIO in categorizer.keywords
+
+    def test_categorize_batch_preserves_order(self):
+        """Testa a categorização em lote mantendo a ordem das transações."""
+        categorizer = KeywordCategorizer()
+        transactions = [
+            Transaction(date=datetime(2023, 1, 1), description="POSTO SHELL", amount=Decimal("80.00"), type=TransactionType.DEBIT),
+            Transaction(date=datetime(2023, 1, 2), description="XYZ LTDA", amount=Decimal("10.00"), type=TransactionType.DEBIT),
+            Transaction(date=datetime(2023, 1, 3), description="Farmácia São João", amount=Decimal("25.00"), type=TransactionType.DEBIT),
+        ]
+
+        categorized = categorizer.categorize_batch(transactions)
+
+        assert [t.category for t in categorized] == [
+            TransactionCategory.TRANSPORTE,
+            TransactionCategory.NAO_CATEGORIZADO,
+            TransactionCategory.SAUDE,
+        ]
+
+    def test_keyword_changes_recompile_patterns(self):
+        """Testa que novas palavras-chave valem mesmo após a primeira categorização."""
+        categorizer = KeywordCategorizer()
+        transaction = Transaction(date=datetime(2023, 1, 1), description="QWZK BLORB", amount=Decimal("10.00"), type=TransactionType.DEBIT)
+        assert categorizer.categorize(transaction).category == TransactionCategory.NAO_CATEGORIZADO
+
+        categorizer.add_keyword(TransactionCategory.SERVICOS, "blorb")
+        assert categorizer.categorize(transaction).category == TransactionCategory.SERVICOS
+
+        categorizer.keywords = {TransactionCategory.LAZER: ["qwzk"]}
+        assert categorizer.categorize(transaction).category == TransactionCategory.LAZER
+
+    def test_categories_without_keywords_are_skipped(self):
+        """Testa que categorias sem palavras-chave (ou só com palavras vazias) não casam com tudo."""
+        categorizer = KeywordCategorizer()
+        categorizer.keywords = {
+            TransactionCategory.OUTROS: [],
+            TransactionCategory.SERVICOS: ["", "!!"],
+            TransactionCategory.LAZER: ["cinema"],
+        }
+        transaction = Transaction(date=datetime(2023, 1, 1), description="CINEMA XYZ", amount=Decimal("20.00"), type=TransactionType.DEBIT)
+
+        assert categorizer.categorize(transaction).category == TransactionCategory.LAZER
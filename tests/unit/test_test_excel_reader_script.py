@@ -45,10 +45,15 @@ def test_test_excel_reader_reads_file(monkeypatch, tmp_path, capsys):
     )
 
     class FakeReader:
+        bank_name = fake_statement.bank_name
+        account_number = fake_statement.account_number
+
         def can_read(self, path):
             return True
         def read(self, path):
-            return fake_statement
+            raise AssertionError("o script deve usar apenas read_iter")
+        def read_iter(self, path):
+            return iter(fake_statement.transactions)
 
     # Patch the ExcelStatementReader class in the script module to our FakeReader
     # scripts.test_excel_reader imported ExcelStatementReader at module import time,
@@ -65,4 +70,8 @@ def test_test_excel_reader_reads_file(monkeypatch, tmp_path, capsys):
 
     assert "Extrato lido com sucesso" in out
     assert "Fake Bank" in out
-    assert "Total de transações" in out
+    assert "Conta: 12345" in out
+    assert "Período: 2025-01-02 a 2025-01-03" in out
+    assert "Total de transações: 2" in out
+    assert "1. 02/01/2025 - Tx1" in out
+    assert "2. 03/01/2025 - Tx2" in out
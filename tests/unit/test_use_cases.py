@@ -33,7 +33,7 @@ def test_execute_success(mock_exists):
     report = "Relatorio gerado"
 
     reader.read.return_value = statement
-    categorizer.categorize.return_value = transaction
+    categorizer.categorize_batch.return_value = [transaction]
     analyzer.analyze.return_value = analysis_result
     report_generator.generate.return_value = report
 
@@ -43,12 +43,13 @@ def test_execute_success(mock_exists):
 
     # Verificações
     reader.read.assert_called_once()
-    categorizer.categorize.assert_called_once_with(transaction)
+    categorizer.categorize_batch.assert_called_once_with([transaction])
     analyzer.analyze.assert_called_once_with(statement)
     report_generator.generate.assert_called_once_with(analysis_result, None)
 
     assert result == analysis_result
     assert generated_report == report
+    assert use_case.last_statement is statement
 
 
 def test_execute_file_not_found():
@@ -79,13 +80,17 @@ def test_extract_analyzer_analyze_file(monkeypatch):
     analyzer = ExtractAnalyzer()
 
     # Mock do use_case.execute para retornar valores simulados
-    monkeypatch.setattr(analyzer.use_case, "execute", lambda file_path, output_path=None: ("result", "report"))
+    def fake_execute(file_path, output_path=None):
+        analyzer.use_case.last_statement = "statement"
+        return "result", "report"
+
+    monkeypatch.setattr(analyzer.use_case, "execute", fake_execute)
 
     result, report, statement = analyzer.analyze_file("data/samples/20250507_Extrato_Integrado.pdf")
 
     assert result == "result"
     assert report == "report"
-    assert statement is not None
+    assert statement == "statement"
 
 
 def test_extract_analyzer_analyze_and_print(monkeypatch, capsys):
@@ -98,3 +103,22 @@ def test_extract_analyzer_analyze_and_print(monkeypatch, capsys):
     captured = capsys.readouterr()
     assert "report" in captured.out
     assert result == "result"
+
+
+def test_extract_analyzer_reuses_stateless_components_only():
+    first = ExtractAnalyzer()
+    second = ExtractAnalyzer()
+
+    assert first.analyzer is second.analyzer
+    # Leitores guardam estado por leitura (moeda, banco) e o categorizador tem
+    # palavras-chave editáveis; nenhum deles é compartilhado
+    assert first.categorizer is not second.categorizer
+    assert all(a is not b for a, b in zip(first.readers, second.readers))
+
+
+def test_extract_analyzer_selects_reader_by_extension():
+    analyzer = ExtractAnalyzer()
+
+    for name in ("extrato.pdf", "extrato.XLSX", "extrato.xls", "extrato.csv"):
+        reader = analyzer._get_appropriate_reader(name)
+        assert reader.can_read(Path(name))